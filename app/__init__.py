@@ -1,10 +1,11 @@
-from flask import Flask
-from flask_cors import CORS
-
-from app.routes import api  # Import your routes (blueprint) at the module level
+def create_app():
+    # Imported here so that importing app.models.* (e.g. from model tests)
+    # does not pull in Flask and every route module.
+    from flask import Flask
+    from flask_cors import CORS
 
+    from app.routes import api
 
-def create_app():
     app = Flask(__name__)
     app.config.from_object("app.config")
     CORS(app)
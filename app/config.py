@@ -11,5 +11,9 @@ JWT_ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRY_MINUTES = 30  # Access tokens expire after 30 minutes
 REFRESH_TOKEN_EXPIRY_DAYS = 7  # Refresh tokens expire after 7 days
 
+# ----- Password Hashing -----
+# bcrypt work factor; the test suite patches it down in tests/conftest.py
+BCRYPT_ROUNDS = 12
+
 # ---- Other Default Values ----
 TAX_RATE = 0.18
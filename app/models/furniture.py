@@ -11,6 +11,9 @@ from app.models.enums import (
     TableShape,
 )
 
+# Multiplier applied to discounted prices to add tax
+_TAX_MULTIPLIER = 1 + TAX_RATE
+
 
 class Furniture(ABC):
     """
@@ -116,7 +119,7 @@ class Furniture(ABC):
 
     def get_final_price(self) -> float:
         """Calculate the final price after applying both discount and tax."""
-        return self.get_discounted_price() * (1 + TAX_RATE)
+        return self.get_discounted_price() * _TAX_MULTIPLIER
 
     def to_dict(self) -> Dict[str, Any]:
         """
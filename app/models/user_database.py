@@ -3,7 +3,7 @@ from typing import Any, Dict, Optional
 
 import bcrypt
 
-from app.config import USERS_FILE
+from app.config import BCRYPT_ROUNDS, USERS_FILE
 from app.utils import JsonFileManager
 
 
@@ -101,7 +101,9 @@ class UserDatabase:
             str: Hashed password (includes salt)
         """
         # Convert password to bytes and hash
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+        return bcrypt.hashpw(
+            password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+        ).decode("utf-8")
 
     def username_exists(self, username: str) -> bool:
         """
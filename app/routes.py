@@ -736,7 +736,7 @@ def process_checkout() -> Tuple[Response, int]:
             return (
                 jsonify(
                     {
-                        "error": f"Invalid payment method."
+                        "error": "Invalid payment method. "
                         f"Valid options are: {', '.join(valid_methods)}"
                     }
                 ),
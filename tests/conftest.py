@@ -0,0 +1,148 @@
+import cProfile
+import os
+import re
+
+import pytest
+
+import app.models.user_database as user_database
+from app.models.user_database import UserDatabase
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _min_bcrypt_rounds():
+    """Hash passwords with bcrypt's minimum work factor for the whole run."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(user_database, "BCRYPT_ROUNDS", 4)
+        yield
+
+
+class InMemoryUserDatabase(UserDatabase):
+    """
+    UserDatabase that keeps users in dicts instead of the JSON file.
+
+    Users are indexed by username, email and id. Every storage method is
+    overridden, so the JSON file is never read or written. Validation and
+    password hashing follow UserDatabase, and credentials are checked by the
+    inherited bcrypt-based validate_credentials.
+    """
+
+    def __new__(cls):
+        # Bypass the UserDatabase singleton so every instance starts empty
+        return object.__new__(cls)
+
+    def __init__(self):
+        # No backing file; set what UserDatabase.__init__ would have
+        self._file_path = None
+        self._initialized = True
+        self._users = {}
+        self._by_email = {}
+        self._by_id = {}
+
+    def username_exists(self, username):
+        return username in self._users
+
+    def email_exists(self, email):
+        return email in self._by_email
+
+    def add_user(self, user_data):
+        # Same checks, in the same order, as UserDatabase.add_user
+        for field in ("username", "email", "password", "id"):
+            if field not in user_data:
+                raise ValueError(f"Missing required field: {field}")
+        if self.username_exists(user_data["username"]):
+            raise ValueError("Username already exists")
+        if self.email_exists(user_data["email"]):
+            raise ValueError("Email already exists")
+        if not self.validate_email(user_data["email"]):
+            raise ValueError("Invalid email format")
+        if not user_data.get("password", "").startswith("$2b$"):
+            if not self.validate_password_strength(user_data["password"]):
+                raise ValueError("Password does not meet strength requirements")
+            user_data["password"] = self._hash_password(user_data["password"])
+
+        user = dict(user_data)
+        self._users[user["username"]] = user
+        self._by_email[user["email"]] = user
+        self._by_id[user["id"]] = user
+
+    def get_user(self, username):
+        return self._users.get(username)
+
+    def get_user_by_email(self, email):
+        return self._by_email.get(email)
+
+    def get_user_by_id(self, user_id):
+        return self._by_id.get(user_id)
+
+    def update_user(self, username, updated_data):
+        user = self._users.get(username)
+        if user is None:
+            return False
+
+        # Same rules as UserDatabase.update_user
+        updated_data.pop("username", None)
+        updated_data.pop("id", None)
+        if "email" in updated_data:
+            email = updated_data["email"]
+            if not self.validate_email(email):
+                raise ValueError("Invalid email format")
+            if self.email_exists(email) and email != user["email"]:
+                raise ValueError("Email is already in use by another account")
+        if "password" in updated_data:
+            if not self.validate_password_strength(updated_data["password"]):
+                raise ValueError("Password does not meet strength requirements")
+            updated_data["password"] = self._hash_password(updated_data["password"])
+
+        if "email" in updated_data:
+            del self._by_email[user["email"]]
+            self._by_email[updated_data["email"]] = user
+        user.update(updated_data)
+        return True
+
+
+@pytest.fixture(scope="module")
+def in_memory_user_db():
+    """Return an empty InMemoryUserDatabase shared within a test module."""
+    return InMemoryUserDatabase()
+
+
+@pytest.fixture(scope="session")
+def flask_app():
+    """
+    Return the app built by run.py, configured once for the test session.
+
+    Imported here rather than at module level, so collecting the tests does
+    not build the app. Tests patch module-level attributes of app.routes, never
+    the app itself, so every test file shares this instance. Responses are
+    serialized compactly and without key sorting, since no test depends on
+    either.
+    """
+    from run import app
+
+    app.config["TESTING"] = True
+    app.json.sort_keys = False
+    app.json.compact = True
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(flask_app):
+    """Create a test client shared by every test in the session."""
+    return flask_app.test_client()
+
+
+# Set PROFILE_TESTS=1 to write a cProfile dump per test into .test-profiles/.
+# The fixture is only defined when enabled, so normal runs pay nothing for it.
+if os.environ.get("PROFILE_TESTS") == "1":
+    _PROFILE_DIR = ".test-profiles"
+
+    @pytest.fixture(autouse=True)
+    def profile_test(request):
+        """Profile the test and save the stats under its node id."""
+        os.makedirs(_PROFILE_DIR, exist_ok=True)
+        name = re.sub(r"[^\w.-]+", "_", request.node.nodeid)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        yield
+        profiler.disable()
+        profiler.dump_stats(os.path.join(_PROFILE_DIR, f"{name}.prof"))
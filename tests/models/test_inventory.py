@@ -12,12 +12,12 @@ from app.utils import JsonFileManager
 
 # Fixture to automatically patch JsonFileManager methods and reset the singleton.
 @pytest.fixture(autouse=True)
-def patch_json_file_manager_and_reset_singleton() -> None:
+def patch_json_file_manager_and_reset_singleton(monkeypatch) -> None:
     """Patch JsonFileManager methods and reset Inventory singleton."""
     # Prevent file I/O by overriding these methods.
-    JsonFileManager.ensure_file_exists = lambda file_path: None
-    JsonFileManager.read_json = lambda file_path: []
-    JsonFileManager.write_json = lambda file_path, data: None
+    monkeypatch.setattr(JsonFileManager, "ensure_file_exists", lambda file_path: None)
+    monkeypatch.setattr(JsonFileManager, "read_json", lambda file_path: [])
+    monkeypatch.setattr(JsonFileManager, "write_json", lambda file_path, data: None)
     # Reset the singleton instance so each test gets a fresh Inventory.
     Inventory._instance = None
 
@@ -121,16 +121,16 @@ def dummy_order_instance(**overrides: Any) -> DummyOrder:
 # Patch JsonFileManager methods for all tests in this file.
 # ----------------------------
 @pytest.fixture(autouse=True)
-def patch_json_methods() -> None:
+def patch_json_methods(monkeypatch) -> None:
     """Patch JsonFileManager methods for all tests in this file.
 
     This fixture ensures that no actual file operations occur during testing.
     By patching the JsonFileManager's methods to do nothing or return predefined values,
     we isolate the tests from the filesystem and make them more predictable and faster.
     """
-    JsonFileManager.ensure_file_exists = lambda file_path: None  # type: ignore
-    JsonFileManager.read_json = lambda file_path: []  # type: ignore
-    JsonFileManager.write_json = lambda file_path, data: None  # type: ignore
+    monkeypatch.setattr(JsonFileManager, "ensure_file_exists", lambda file_path: None)
+    monkeypatch.setattr(JsonFileManager, "read_json", lambda file_path: [])
+    monkeypatch.setattr(JsonFileManager, "write_json", lambda file_path, data: None)
 
 
 # ----------------------------
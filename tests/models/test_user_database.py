@@ -1,3 +1,6 @@
+import base64
+from functools import lru_cache
+from itertools import count
 from typing import Any, Dict, List
 
 import bcrypt
@@ -6,12 +9,68 @@ import pytest
 from app.models.user_database import UserDatabase
 from app.utils import JsonFileManager
 
+# Hashed once at import time for the validate_credentials tests; cost 4 keeps
+# bcrypt's key schedule cheap while checkpw still reads the cost from the hash.
+_PLAIN_PASSWORD = "Aa1!cccc"
+_HASHED_PASSWORD = bcrypt.hashpw(
+    _PLAIN_PASSWORD.encode("utf-8"), bcrypt.gensalt(rounds=4)
+).decode("utf-8")
 
-# Fixture to reset the singleton and patch JsonFileManager methods
-@pytest.fixture(autouse=True)
-def reset_user_database():
-    """Reset the UserDatabase singleton and mock the JsonFileManager methods."""
-    UserDatabase._instance = None
+
+# Fixture to bypass the singleton for the whole module
+@pytest.fixture(scope="module", autouse=True)
+def fresh_user_database_instances():
+    """Make every UserDatabase() call return a new, uninitialized instance."""
+
+    def new_instance(cls, *args, **kwargs):
+        instance = object.__new__(cls)
+        instance._initialized = False
+        return instance
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(UserDatabase, "__new__", new_instance)
+        yield
+
+
+# bcrypt encodes salts with its own base64 alphabet
+_BCRYPT_B64 = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",
+    b"./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789",
+)
+
+
+# Fixture to generate bcrypt salts from a counter instead of OS randomness
+@pytest.fixture(scope="module", autouse=True)
+def deterministic_salts():
+    """Replace bcrypt.gensalt with a deterministic, well-formed salt source."""
+    counter = count()
+
+    def gensalt(rounds=12, prefix=b"2b"):
+        raw = next(counter).to_bytes(16, "little")
+        salt = base64.b64encode(raw).rstrip(b"=").translate(_BCRYPT_B64)
+        return b"$%s$%02d$%s" % (prefix, rounds, salt)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(bcrypt, "gensalt", gensalt)
+        yield
+
+
+# Fixture to memoize the pure validation helpers for the whole module
+@pytest.fixture(scope="module", autouse=True)
+def cached_validators():
+    """Wrap validate_email and validate_password_strength in an LRU cache."""
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ("validate_email", "validate_password_strength"):
+            func = getattr(UserDatabase, name)
+            mp.setattr(UserDatabase, name, staticmethod(lru_cache(maxsize=256)(func)))
+        yield
+
+
+# Fixture to patch JsonFileManager methods with in-memory storage.
+# Not autouse: only tests that construct a UserDatabase request it.
+@pytest.fixture
+def reset_user_database(monkeypatch):
+    """Mock the JsonFileManager methods with a fresh in-memory store."""
     # Use an in-memory list to simulate the JSON file storage.
     storage: List[Dict[str, Any]] = []
 
@@ -25,27 +84,32 @@ def reset_user_database():
         nonlocal storage
         storage = data
 
-    JsonFileManager.ensure_file_exists = dummy_ensure
-    JsonFileManager.read_json = dummy_read
-    JsonFileManager.write_json = dummy_write
+    monkeypatch.setattr(JsonFileManager, "ensure_file_exists", dummy_ensure)
+    monkeypatch.setattr(JsonFileManager, "read_json", dummy_read)
+    monkeypatch.setattr(JsonFileManager, "write_json", dummy_write)
     yield storage  # tests can inspect storage if needed
 
 
+def _case_ids(cases):
+    """Return short positional ids for a tuple of parametrize cases."""
+    return [f"c{i}" for i in range(len(cases))]
+
+
 # ---------------------------
 # Tests for static validation methods
 # ---------------------------
-@pytest.mark.parametrize(
-    "email,expected",
-    [
-        ("user@example.com", True),
-        ("user.name+tag@domain.co", True),
-        ("user@sub.domain.com", True),
-        ("invalid-email", False),
-        ("user@.com", False),
-        ("", False),
-        (None, False),  # None will fail the "if not email" check
-    ],
+_EMAIL_CASES = (
+    ("user@example.com", True),
+    ("user.name+tag@domain.co", True),
+    ("user@sub.domain.com", True),
+    ("invalid-email", False),
+    ("user@.com", False),
+    ("", False),
+    (None, False),  # None will fail the "if not email" check
 )
+
+
+@pytest.mark.parametrize("email,expected", _EMAIL_CASES, ids=_case_ids(_EMAIL_CASES))
 def test_validate_email(email, expected) -> None:
     """Test the email validation function with various
     valid and invalid email formats."""
@@ -54,16 +118,20 @@ def test_validate_email(email, expected) -> None:
     assert result is expected
 
 
+_PASSWORD_STRENGTH_CASES = (
+    ("Aa1!aaaa", True),  # meets all requirements
+    ("Aa1!aa", False),  # too short
+    ("aaaaaaaa", False),  # no uppercase, digit, special
+    ("AAAAAAAA", False),  # no lowercase, digit, special
+    ("AaAAAAAA", False),  # no digit, special
+    ("Aa1AAAAA", False),  # no special character
+)
+
+
 @pytest.mark.parametrize(
     "password,expected",
-    [
-        ("Aa1!aaaa", True),  # meets all requirements
-        ("Aa1!aa", False),  # too short
-        ("aaaaaaaa", False),  # no uppercase, digit, special
-        ("AAAAAAAA", False),  # no lowercase, digit, special
-        ("AaAAAAAA", False),  # no digit, special
-        ("Aa1AAAAA", False),  # no special character
-    ],
+    _PASSWORD_STRENGTH_CASES,
+    ids=_case_ids(_PASSWORD_STRENGTH_CASES),
 )
 def test_validate_password_strength(password, expected) -> None:
     """Test password strength validation against various password patterns."""
@@ -77,21 +145,19 @@ def test_validate_password_strength(password, expected) -> None:
 def test_username_exists(reset_user_database) -> None:
     """Test that username existence check correctly identifies
     existing and non-existing usernames."""
-    reset_user_database.extend(
-        [
-            {
-                "username": "user1",
-                "email": "u1@example.com",
-                "password": "hashed",
-                "id": "U1",
-            },
-            {
-                "username": "user2",
-                "email": "u2@example.com",
-                "password": "hashed",
-                "id": "U2",
-            },
-        ]
+    reset_user_database += (
+        {
+            "username": "user1",
+            "email": "u1@example.com",
+            "password": "hashed",
+            "id": "U1",
+        },
+        {
+            "username": "user2",
+            "email": "u2@example.com",
+            "password": "hashed",
+            "id": "U2",
+        },
     )
     db = UserDatabase()
     assert db.username_exists("user1") is True
@@ -101,15 +167,13 @@ def test_username_exists(reset_user_database) -> None:
 def test_email_exists(reset_user_database) -> None:
     """Test that email existence check correctly identifies
     existing and non-existing email addresses."""
-    reset_user_database.extend(
-        [
-            {
-                "username": "user1",
-                "email": "u1@example.com",
-                "password": "hashed",
-                "id": "U1",
-            },
-        ]
+    reset_user_database.append(
+        {
+            "username": "user1",
+            "email": "u1@example.com",
+            "password": "hashed",
+            "id": "U1",
+        }
     )
     db = UserDatabase()
     assert db.email_exists("u1@example.com") is True
@@ -119,26 +183,30 @@ def test_email_exists(reset_user_database) -> None:
 # ---------------------------
 # Tests for add_user
 # ---------------------------
+_MISSING_FIELD_CASES = (
+    (
+        {"email": "test@example.com", "password": "Aa1!aaaa", "id": "U1"},
+        "Missing required field: username",
+    ),
+    (
+        {"username": "user", "password": "Aa1!aaaa", "id": "U1"},
+        "Missing required field: email",
+    ),
+    (
+        {"username": "user", "email": "test@example.com", "id": "U1"},
+        "Missing required field: password",
+    ),
+    (
+        {"username": "user", "email": "test@example.com", "password": "Aa1!aaaa"},
+        "Missing required field: id",
+    ),
+)
+
+
 @pytest.mark.parametrize(
     "user_data, error_msg",
-    [
-        (
-            {"email": "test@example.com", "password": "Aa1!aaaa", "id": "U1"},
-            "Missing required field: username",
-        ),
-        (
-            {"username": "user", "password": "Aa1!aaaa", "id": "U1"},
-            "Missing required field: email",
-        ),
-        (
-            {"username": "user", "email": "test@example.com", "id": "U1"},
-            "Missing required field: password",
-        ),
-        (
-            {"username": "user", "email": "test@example.com", "password": "Aa1!aaaa"},
-            "Missing required field: id",
-        ),
-    ],
+    _MISSING_FIELD_CASES,
+    ids=_case_ids(_MISSING_FIELD_CASES),
 )
 def test_add_user_missing_fields(user_data, error_msg, reset_user_database) -> None:
     """Test that adding users with missing required fields raises appropriate
@@ -151,15 +219,13 @@ def test_add_user_missing_fields(user_data, error_msg, reset_user_database) -> N
 def test_add_user_duplicate_username(reset_user_database) -> None:
     """Test that attempting to add a user with an existing
     username raises appropriate error."""
-    reset_user_database.extend(
-        [
-            {
-                "username": "user",
-                "email": "u1@example.com",
-                "password": "hashed",
-                "id": "U1",
-            }
-        ]
+    reset_user_database.append(
+        {
+            "username": "user",
+            "email": "u1@example.com",
+            "password": "hashed",
+            "id": "U1",
+        }
     )
     db = UserDatabase()
     user_data = {
@@ -175,15 +241,13 @@ def test_add_user_duplicate_username(reset_user_database) -> None:
 def test_add_user_duplicate_email(reset_user_database) -> None:
     """Test that attempting to add a user with an existing email
     raises appropriate error."""
-    reset_user_database.extend(
-        [
-            {
-                "username": "user1",
-                "email": "u1@example.com",
-                "password": "hashed",
-                "id": "U1",
-            }
-        ]
+    reset_user_database.append(
+        {
+            "username": "user1",
+            "email": "u1@example.com",
+            "password": "hashed",
+            "id": "U1",
+        }
     )
     db = UserDatabase()
     user_data = {
@@ -205,30 +269,31 @@ def test_add_user_invalid_email_format(email, reset_user_database) -> None:
         db.add_user(user_data)
 
 
-# Parameterized tests for various weak passwords.
-@pytest.mark.parametrize(
-    "weak_password",
-    [
-        "short1!",  # 7 characters, too short.
-        "alllowercase1!",  # no uppercase.
-        "ALLUPPERCASE1!",  # no lowercase.
-        "NoDigits!",  # no digit.
-        "NoSpecial1",  # no special character.
-    ],
+# Weak passwords rejected by add_user before any hashing happens.
+_WEAK_PASSWORDS = (
+    "short1!",  # 7 characters, too short.
+    "alllowercase1!",  # no uppercase.
+    "ALLUPPERCASE1!",  # no lowercase.
+    "NoDigits!",  # no digit.
+    "NoSpecial1",  # no special character.
 )
-def test_add_user_weak_passwords(reset_user_database, weak_password) -> None:
+
+
+def test_add_user_weak_passwords(reset_user_database) -> None:
     """Test that adding a user with weak passwords raises appropriate error."""
     db = UserDatabase()
-    user_data = {
-        "username": "user",
-        "email": "test@example.com",
-        "password": weak_password,
-        "id": "U1",
-    }
-    with pytest.raises(
-        ValueError, match="Password does not meet strength requirements"
-    ):
-        db.add_user(user_data)
+    for weak_password in _WEAK_PASSWORDS:
+        user_data = {
+            "username": "user",
+            "email": "test@example.com",
+            "password": weak_password,
+            "id": "U1",
+        }
+        with pytest.raises(
+            ValueError, match="Password does not meet strength requirements"
+        ):
+            db.add_user(user_data)
+    assert reset_user_database == []
 
 
 # Dedicated test for a 7-character password ("aaaaaaa") to ensure the branch is hit.
@@ -268,15 +333,13 @@ def test_add_user_success(reset_user_database) -> None:
 # ---------------------------
 def test_get_user(reset_user_database) -> None:
     """Test retrieving a user by username works correctly."""
-    reset_user_database.extend(
-        [
-            {
-                "username": "user",
-                "email": "test@example.com",
-                "password": "hashed",
-                "id": "U1",
-            }
-        ]
+    reset_user_database.append(
+        {
+            "username": "user",
+            "email": "test@example.com",
+            "password": "hashed",
+            "id": "U1",
+        }
     )
     db = UserDatabase()
     user = db.get_user("user")
@@ -287,15 +350,13 @@ def test_get_user(reset_user_database) -> None:
 
 def test_get_user_by_email(reset_user_database) -> None:
     """Test retrieving a user by email works correctly."""
-    reset_user_database.extend(
-        [
-            {
-                "username": "user",
-                "email": "test@example.com",
-                "password": "hashed",
-                "id": "U1",
-            }
-        ]
+    reset_user_database.append(
+        {
+            "username": "user",
+            "email": "test@example.com",
+            "password": "hashed",
+            "id": "U1",
+        }
     )
     db = UserDatabase()
     user = db.get_user_by_email("test@example.com")
@@ -306,15 +367,13 @@ def test_get_user_by_email(reset_user_database) -> None:
 
 def test_get_user_by_id(reset_user_database) -> None:
     """Test retrieving a user by ID works correctly."""
-    reset_user_database.extend(
-        [
-            {
-                "username": "user",
-                "email": "test@example.com",
-                "password": "hashed",
-                "id": "U1",
-            }
-        ]
+    reset_user_database.append(
+        {
+            "username": "user",
+            "email": "test@example.com",
+            "password": "hashed",
+            "id": "U1",
+        }
     )
     db = UserDatabase()
     user = db.get_user_by_id("U1")
@@ -335,15 +394,13 @@ def test_update_user_not_found(reset_user_database) -> None:
 
 def test_update_user_invalid_email_format(reset_user_database) -> None:
     """Test that updating a user with invalid email format raises appropriate error."""
-    reset_user_database.extend(
-        [
-            {
-                "username": "user",
-                "email": "old@example.com",
-                "password": "hashed",
-                "id": "U1",
-            }
-        ]
+    reset_user_database.append(
+        {
+            "username": "user",
+            "email": "old@example.com",
+            "password": "hashed",
+            "id": "U1",
+        }
     )
     db = UserDatabase()
     with pytest.raises(ValueError, match="Invalid email format"):
@@ -353,21 +410,19 @@ def test_update_user_invalid_email_format(reset_user_database) -> None:
 def test_update_user_email_duplicate(reset_user_database) -> None:
     """Test that updating a user with an email already in use
     by another account raises appropriate error."""
-    reset_user_database.extend(
-        [
-            {
-                "username": "user1",
-                "email": "a@example.com",
-                "password": "hashed",
-                "id": "U1",
-            },
-            {
-                "username": "user2",
-                "email": "b@example.com",
-                "password": "hashed",
-                "id": "U2",
-            },
-        ]
+    reset_user_database += (
+        {
+            "username": "user1",
+            "email": "a@example.com",
+            "password": "hashed",
+            "id": "U1",
+        },
+        {
+            "username": "user2",
+            "email": "b@example.com",
+            "password": "hashed",
+            "id": "U2",
+        },
     )
     db = UserDatabase()
     with pytest.raises(ValueError, match="Email is already in use by another account"):
@@ -377,15 +432,13 @@ def test_update_user_email_duplicate(reset_user_database) -> None:
 def test_update_user_password(reset_user_database) -> None:
     """Test that updating a user's password works correctly."""
     db = UserDatabase()
-    reset_user_database.extend(
-        [
-            {
-                "username": "user",
-                "email": "test@example.com",
-                "password": "$2b$hashed",
-                "id": "U1",
-            }
-        ]
+    reset_user_database.append(
+        {
+            "username": "user",
+            "email": "test@example.com",
+            "password": "$2b$hashed",
+            "id": "U1",
+        }
     )
     result = db.update_user("user", {"password": "Aa1!bbbb"})
     assert result is True
@@ -407,15 +460,13 @@ def test_update_user_password(reset_user_database) -> None:
 def test_update_user_weak_password(reset_user_database, weak_password) -> None:
     """Test that updating a user with weak passwords raises appropriate error."""
     db = UserDatabase()
-    reset_user_database.extend(
-        [
-            {
-                "username": "user",
-                "email": "test@example.com",
-                "password": "$2b$hashed",
-                "id": "U1",
-            }
-        ]
+    reset_user_database.append(
+        {
+            "username": "user",
+            "email": "test@example.com",
+            "password": "$2b$hashed",
+            "id": "U1",
+        }
     )
     with pytest.raises(
         ValueError, match="Password does not meet strength requirements"
@@ -425,15 +476,13 @@ def test_update_user_weak_password(reset_user_database, weak_password) -> None:
 
 def test_update_user_ignore_username_and_id(reset_user_database) -> None:
     """Test that user updates ignore attempts to change username and ID."""
-    reset_user_database.extend(
-        [
-            {
-                "username": "user",
-                "email": "test@example.com",
-                "password": "$2b$hashed",
-                "id": "U1",
-            }
-        ]
+    reset_user_database.append(
+        {
+            "username": "user",
+            "email": "test@example.com",
+            "password": "$2b$hashed",
+            "id": "U1",
+        }
     )
     db = UserDatabase()
     result = db.update_user(
@@ -458,17 +507,13 @@ def test_validate_credentials_user_not_found(reset_user_database) -> None:
 
 def test_validate_credentials_wrong_password(reset_user_database) -> None:
     """Test that validating credentials with incorrect password returns None."""
-    plain = "Aa1!cccc"
-    hashed = bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
-    reset_user_database.extend(
-        [
-            {
-                "username": "user",
-                "email": "test@example.com",
-                "password": hashed,
-                "id": "U1",
-            }
-        ]
+    reset_user_database.append(
+        {
+            "username": "user",
+            "email": "test@example.com",
+            "password": _HASHED_PASSWORD,
+            "id": "U1",
+        }
     )
     db = UserDatabase()
     result = db.validate_credentials("user", "wrongpass")
@@ -477,33 +522,29 @@ def test_validate_credentials_wrong_password(reset_user_database) -> None:
 
 def test_validate_credentials_success_by_username(reset_user_database) -> None:
     """Test successful credential validation using username."""
-    plain = "Aa1!cccc"
-    hashed = bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
     user_data = {
         "username": "user",
         "email": "test@example.com",
-        "password": hashed,
+        "password": _HASHED_PASSWORD,
         "id": "U1",
     }
     reset_user_database.append(user_data)
     db = UserDatabase()
-    result = db.validate_credentials("user", plain)
+    result = db.validate_credentials("user", _PLAIN_PASSWORD)
     assert result is not None
     assert result["username"] == "user"
 
 
 def test_validate_credentials_success_by_email(reset_user_database) -> None:
     """Test successful credential validation using email."""
-    plain = "Aa1!cccc"
-    hashed = bcrypt.hashpw(plain.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
     user_data = {
         "username": "user",
         "email": "test@example.com",
-        "password": hashed,
+        "password": _HASHED_PASSWORD,
         "id": "U1",
     }
     reset_user_database.append(user_data)
     db = UserDatabase()
-    result = db.validate_credentials("test@example.com", plain)
+    result = db.validate_credentials("test@example.com", _PLAIN_PASSWORD)
     assert result is not None
     assert result["email"] == "test@example.com"
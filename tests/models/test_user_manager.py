@@ -1,3 +1,4 @@
+from types import MappingProxyType
 from unittest.mock import Mock
 
 import pytest
@@ -5,43 +6,55 @@ import pytest
 from app.models.user_manager import UserManager
 from app.utils import AuthenticationError
 
+# Token prefixes used by FakeJWTManager
+_ACCESS_PFX = "access_"
+_ACCESS_PFX_LEN = len(_ACCESS_PFX)
+_REFRESH_PFX = "refresh_"
+_REFRESH_PFX_LEN = len(_REFRESH_PFX)
+
 
 # Fake implementation of UserDatabase to simulate behavior
 class FakeUserDatabase:
     """Simulates UserDatabase behavior for testing."""
 
+    __slots__ = ("users", "_by_id", "_by_email")
+
     def __init__(self):
-        """Initialize with empty users dictionary."""
+        """Initialize with empty users dictionary and lookup indexes."""
         self.users = {}
+        self._by_id = {}
+        self._by_email = {}
 
     def add_user(self, user_data):
         """Add a user to the database."""
         if user_data["username"] in self.users:
             raise ValueError("User already exists")
         self.users[user_data["username"]] = user_data
+        self._by_id[user_data["id"]] = user_data
+        self._by_email[user_data["email"]] = user_data
 
     def validate_credentials(self, username_or_email, password):
         """Validate user credentials."""
-        for user in self.users.values():
-            if (
-                user["username"] == username_or_email
-                or user["email"] == username_or_email
-            ) and user["password"] == password:
-                return user
+        user = self.users.get(username_or_email) or self._by_email.get(
+            username_or_email
+        )
+        if user and user["password"] == password:
+            return user
         return None
 
     def get_user_by_id(self, user_id):
         """Get a user by ID."""
-        for user in self.users.values():
-            if user["id"] == user_id:
-                return user
-        return None
+        return self._by_id.get(user_id)
 
     def update_user(self, username, updated_data):
         """Update a user's data."""
         if username not in self.users:
             raise ValueError("User not found")
-        self.users[username].update(updated_data)
+        user = self.users[username]
+        if "email" in updated_data:
+            self._by_email.pop(user["email"], None)
+            self._by_email[updated_data["email"]] = user
+        user.update(updated_data)
         return True
 
 
@@ -49,25 +62,27 @@ class FakeUserDatabase:
 class FakeJWTManager:
     """Simulates JWTManager behavior for testing."""
 
+    __slots__ = ()
+
     def generate_token_pair(self, user_id, username):
         """Generate a fake token pair."""
         return {
-            "access_token": f"access_{user_id}",
-            "refresh_token": f"refresh_{user_id}",
+            "access_token": f"{_ACCESS_PFX}{user_id}",
+            "refresh_token": f"{_REFRESH_PFX}{user_id}",
         }
 
     def verify_token(self, token):
         """Verify a token and return payload."""
-        if token.startswith("access_"):
-            user_id = token.split("_", 1)[1]
+        if token[:_ACCESS_PFX_LEN] == _ACCESS_PFX:
+            user_id = token[_ACCESS_PFX_LEN:]
             return {"sub": user_id, "username": "dummy", "token_type": "access"}
         raise Exception("Invalid token")
 
     def refresh_access_token(self, refresh_token):
         """Refresh an access token."""
-        if refresh_token.startswith("refresh_"):
-            user_id = refresh_token.split("_", 1)[1]
-            return f"access_{user_id}"
+        if refresh_token[:_REFRESH_PFX_LEN] == _REFRESH_PFX:
+            user_id = refresh_token[_REFRESH_PFX_LEN:]
+            return f"{_ACCESS_PFX}{user_id}"
         raise AuthenticationError("Invalid refresh token")
 
 
@@ -81,16 +96,33 @@ def user_manager():
 
 
 # Fixture for sample user data
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_user_data():
-    """Return sample user data for testing."""
-    return {
-        "username": "testuser",
-        "full_name": "Test User",
-        "email": "test@example.com",
-        "password": "password123",
-        "shipping_address": "123 Test St",
-    }
+    """Return read-only sample user data shared across the module."""
+    return MappingProxyType(
+        {
+            "username": "testuser",
+            "full_name": "Test User",
+            "email": "test@example.com",
+            "password": "password123",
+            "shipping_address": "123 Test St",
+        }
+    )
+
+
+# Fixture for a registered and logged-in user
+@pytest.fixture
+def logged_in(user_manager, sample_user_data):
+    """Register and log in the sample user.
+
+    Returns:
+        Tuple of (user_manager, user, tokens)
+    """
+    user_manager.register_user(**sample_user_data)
+    user, tokens = user_manager.login(
+        sample_user_data["username"], sample_user_data["password"]
+    )
+    return user_manager, user, tokens
 
 
 # --- Tests for register_user method ---
@@ -134,12 +166,9 @@ def test_login(
 
 
 # --- Tests for authenticate_with_token method ---
-def test_authenticate_with_token_success(user_manager, sample_user_data) -> None:
+def test_authenticate_with_token_success(logged_in) -> None:
     """Test successful authentication with token."""
-    user_manager.register_user(**sample_user_data)
-    user, tokens = user_manager.login(
-        sample_user_data["username"], sample_user_data["password"]
-    )
+    user_manager, user, tokens = logged_in
     token = tokens["access_token"]
     authenticated_user = user_manager.authenticate_with_token(token)
     assert authenticated_user.token == token
@@ -151,7 +180,7 @@ def test_authenticate_with_token_failure(user_manager) -> None:
         user_manager.authenticate_with_token("invalid_token")
 
 
-def test_authenticate_with_token_missing_sub(mocker):
+def test_authenticate_with_token_missing_sub():
     # Create mocks for the dependencies.
     fake_user_db = Mock()
     fake_jwt_manager = Mock()
@@ -169,7 +198,7 @@ def test_authenticate_with_token_missing_sub(mocker):
         user_manager.authenticate_with_token("dummy_token")
 
 
-def test_authenticate_with_token_existing_cart(user_manager, sample_user_data):
+def test_authenticate_with_token_existing_cart(logged_in):
     """
     Test that when a user already has an active cart in the cache,
     the user's new shopping cart is replaced by the cached one.
@@ -177,11 +206,8 @@ def test_authenticate_with_token_existing_cart(user_manager, sample_user_data):
         user._shopping_cart = self._active_carts[user_id]
     """
 
-    # 1) Register and login a user, so we have a valid token.
-    user_manager.register_user(**sample_user_data)
-    user, tokens = user_manager.login(
-        sample_user_data["username"], sample_user_data["password"]
-    )
+    # 1) Start from a registered, logged-in user, so we have a valid token.
+    user_manager, user, tokens = logged_in
     token = tokens["access_token"]
 
     # 2) First authentication - sets the new cart in the cache.
@@ -201,10 +227,10 @@ def test_authenticate_with_token_existing_cart(user_manager, sample_user_data):
 def test_authenticate_with_token_missing_token_type(user_manager, monkeypatch) -> None:
     """Test authentication failure when token payload is missing token_type."""
 
-    def fake_verify_token(token):
+    def fake_verify_token(self, token):
         return {"sub": "some_id", "username": "dummy"}  # no token_type provided
 
-    monkeypatch.setattr(user_manager._jwt_manager, "verify_token", fake_verify_token)
+    monkeypatch.setattr(FakeJWTManager, "verify_token", fake_verify_token)
     with pytest.raises(AuthenticationError, match="Invalid token"):
         user_manager.authenticate_with_token("access_some_id")
 
@@ -213,10 +239,10 @@ def test_authenticate_with_token_missing_token_type(user_manager, monkeypatch) -
 def test_authenticate_with_token_wrong_token_type(user_manager, monkeypatch) -> None:
     """Test authentication failure with wrong token type."""
 
-    def fake_verify_token(token):
+    def fake_verify_token(self, token):
         return {"sub": "some_id", "username": "dummy", "token_type": "refresh"}
 
-    monkeypatch.setattr(user_manager._jwt_manager, "verify_token", fake_verify_token)
+    monkeypatch.setattr(FakeJWTManager, "verify_token", fake_verify_token)
     with pytest.raises(
         AuthenticationError, match="Invalid token type for authentication"
     ):
@@ -227,21 +253,18 @@ def test_authenticate_with_token_wrong_token_type(user_manager, monkeypatch) ->
 def test_authenticate_with_token_user_not_found(user_manager, monkeypatch) -> None:
     """Test authentication failure when user not found in database."""
 
-    def fake_verify_token(token):
+    def fake_verify_token(self, token):
         return {"sub": "nonexistent", "username": "dummy", "token_type": "access"}
 
-    monkeypatch.setattr(user_manager._jwt_manager, "verify_token", fake_verify_token)
+    monkeypatch.setattr(FakeJWTManager, "verify_token", fake_verify_token)
     with pytest.raises(AuthenticationError, match="User not found"):
         user_manager.authenticate_with_token("access_nonexistent")
 
 
 # --- Tests for refresh_access_token method ---
-def test_refresh_access_token_success(user_manager, sample_user_data) -> None:
+def test_refresh_access_token_success(logged_in) -> None:
     """Test successful access token refresh."""
-    user_manager.register_user(**sample_user_data)
-    user, tokens = user_manager.login(
-        sample_user_data["username"], sample_user_data["password"]
-    )
+    user_manager, user, tokens = logged_in
     new_access = user_manager.refresh_access_token(tokens["refresh_token"])
     assert new_access.startswith("access_")
 
@@ -325,10 +348,10 @@ def test_update_password_update_failure(
     """Test password update failure due to validation errors."""
     user_manager.register_user(**sample_user_data)
 
-    def fake_update_user(username, updated_data):
+    def fake_update_user(self, username, updated_data):
         raise ValueError("New password is too weak")
 
-    monkeypatch.setattr(user_manager._user_db, "update_user", fake_update_user)
+    monkeypatch.setattr(FakeUserDatabase, "update_user", fake_update_user)
     with pytest.raises(
         ValueError, match="Password update failed: New password is too weak"
     ):
@@ -1,6 +1,30 @@
-import unittest
-import uuid
-from unittest.mock import patch
+"""
+Regression test for the complete e-commerce purchase flow.
+
+This test verifies the end-to-end functionality of the purchase process by testing:
+    1. User authentication and session management
+    2. Product browsing and cart operations
+    3. Price calculations including tax application
+    4. Discount strategy application
+    5. Checkout process and order creation
+    6. Inventory updates after purchase
+
+The test provides comprehensive coverage of integration points between key system
+components: UserManager, Inventory, ShoppingCart, and CheckoutSystem. It ensures
+that these components work correctly together and that the complete purchase flow
+functions as expected.
+
+This regression test helps catch regressions when changes are made to any of the
+individual components in the purchase flow.
+
+The system components, test products and authenticated test user are built once per
+module; each payment method only gets a freshly emptied cart.
+"""
+
+import itertools
+import pickle
+
+import pytest
 
 from app.config import TAX_RATE
 from app.models.checkout_system import CheckoutSystem
@@ -10,168 +34,214 @@ from app.models.furniture import Chair, Table
 from app.models.inventory import Inventory
 from app.models.jwt_manager import JWTManager
 from app.models.order_manager import OrderManager
-from app.models.user_database import UserDatabase
 from app.models.user_manager import UserManager
 
+TEST_PASSWORD = "Test@1234"  # Satisfies password strength requirements
+TEST_FULL_NAME = "Test User"
+TEST_ADDRESS = "123 Test Street, Test City, 12345"
+
+# Price multipliers used by the expected totals
+TAX_MULT = 1 + TAX_RATE
+DISCOUNT_MULT = 0.9  # 10% off
+
+# Suffix for unique test usernames; users live in an in-memory database, so
+# this only needs to be unique within the run.
+_UID = itertools.count()
+
+
+# ---------------------------
+# Module-scoped system components
+# ---------------------------
+@pytest.fixture(scope="module", autouse=True)
+def _patch_persistence():
+    """Keep inventory and order writes off disk for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Inventory, "_save_inventory", lambda self: None)
+        mp.setattr(Inventory, "update_quantity", lambda self, *args: True)
+        mp.setattr(OrderManager, "save_order", lambda self, order: True)
+        yield
+
+
+@pytest.fixture(scope="module")
+def jwt_manager():
+    """Return the JWT manager."""
+    return JWTManager()
+
+
+@pytest.fixture(scope="module")
+def user_manager(in_memory_user_db, jwt_manager):
+    """Return a UserManager wired to an in-memory database and the JWT manager."""
+    return UserManager(in_memory_user_db, jwt_manager)
+
+
+@pytest.fixture(scope="module")
+def inventory():
+    """Return the inventory, restoring its contents after the module."""
+    inventory = Inventory()
+    snapshot = pickle.dumps(inventory._inventory)
+    yield inventory
+    inventory._inventory = pickle.loads(snapshot)
+
+
+@pytest.fixture(scope="module")
+def order_manager():
+    """Return the order manager."""
+    return OrderManager()
+
+
+@pytest.fixture(scope="module")
+def checkout_system(inventory, order_manager):
+    """Return a CheckoutSystem wired to the module's inventory and orders."""
+    return CheckoutSystem(inventory, order_manager)
+
+
+@pytest.fixture(scope="module")
+def chair(inventory):
+    """Add a test chair to the inventory and return it."""
+    chair = Chair(
+        price=100.0, material=ChairMaterial.WOOD.value, description="Test Chair"
+    )
+    inventory.add_furniture(chair, quantity=10)
+    return chair
+
+
+@pytest.fixture(scope="module")
+def table(inventory):
+    """Add a test table to the inventory and return it."""
+    table = Table(price=200.0, shape=TableShape.ROUND.value, description="Test Table")
+    inventory.add_furniture(table, quantity=5)
+    return table
+
+
+# ---------------------------
+# Test user and cart
+# ---------------------------
+def _register_test_user(user_manager):
+    """Register a uniquely named test user and return it."""
+    test_username = f"testuser_{next(_UID)}"
+    return user_manager.register_user(
+        username=test_username,
+        full_name=TEST_FULL_NAME,
+        email=f"{test_username}@example.com",
+        password=TEST_PASSWORD,
+        shipping_address=TEST_ADDRESS,
+    )
+
 
-class PurchaseFlowRegressionTest(unittest.TestCase):
+def _login_user_for_test(user_manager, user):
+    """Log the user in through UserManager.login and return (user, tokens)."""
+    return user_manager.login(user.username, TEST_PASSWORD)
+
+
+def _simulate_login(user):
+    """Mark the user as authenticated without issuing JWT tokens."""
+    user.token = "test-access-token"
+    return user
+
+
+@pytest.fixture(scope="module")
+def test_user(user_manager):
+    """Register and authenticate a test user shared by every test in the module."""
+    return _simulate_login(_register_test_user(user_manager))
+
+
+@pytest.fixture
+def cart(test_user):
+    """Return the test user's cart, emptied and without a discount."""
+    cart = test_user.shopping_cart
+    cart.clear()
+    cart.discount_strategy = None
+    return cart
+
+
+@pytest.fixture
+def patched_checkout(monkeypatch, checkout_system):
+    """Return the checkout system with the two stock lookups stubbed in order."""
+    stock = iter([10, 5])
+    monkeypatch.setattr(
+        Inventory, "get_quantity", lambda self, furniture_id: next(stock)
+    )
+    return checkout_system
+
+
+@pytest.mark.parametrize("payment_method", list(PaymentMethod))
+def test_complete_purchase_flow(
+    test_user, cart, chair, table, patched_checkout, payment_method
+):
     """
-    Regression test for the complete e-commerce purchase flow.
-
-    This test verifies the end-to-end functionality of the purchase process by testing:
-        1. User authentication and session management
-        2. Product browsing and cart operations
-        3. Price calculations including tax application
-        4. Discount strategy application
-        5. Checkout process and order creation
-        6. Inventory updates after purchase
-
-    The test provides comprehensive coverage of integration points between key system
-    components: UserManager, Inventory, ShoppingCart, and CheckoutSystem. It ensures
-    that these components work correctly together and that the complete purchase flow
-    functions as expected.
-
-    This regression test helps catch regressions when changes are made to any of the
-    individual components in the purchase flow.
+    Test the complete purchase flow from adding items to completing checkout.
     """
+    # Step 1: Verify user is authenticated
+    assert test_user.is_authenticated
+
+    # Step 2: Add items to cart
+    cart.add_item(chair, 2)
+    cart.add_item(table, 1)
+
+    # Verify items were added correctly
+    cart_items = cart.get_items()
+    assert len(cart_items) == 2
+
+    # Find chair and table in cart
+    by_id = {item[0].id: item for item in cart_items}
+    assert chair.id in by_id, "Chair should be in the cart"
+    assert table.id in by_id, "Table should be in the cart"
+    chair_in_cart = by_id[chair.id]
+    table_in_cart = by_id[table.id]
+    assert chair_in_cart[1] == 2, "Should have 2 chairs in cart"
+    assert table_in_cart[1] == 1, "Should have 1 table in cart"
+
+    # Step 3: Calculate initial cart total
+    initial_subtotal = cart.get_subtotal()
+
+    # Sum of base price with tax (TAX_RATE from application config) * quantity
+    expected_subtotal = sum(
+        price * TAX_MULT * quantity for price, quantity in ((100.0, 2), (200.0, 1))
+    )
+
+    assert initial_subtotal == pytest.approx(expected_subtotal, abs=5e-3)
+
+    # Step 4: Apply a discount to the cart
+    discount_strategy = PercentageDiscountStrategy(10)  # 10% discount
+    cart.discount_strategy = discount_strategy
+
+    # Calculate new total and verify discount was applied
+    discounted_total = cart.get_total()
+
+    # The discount is applied to the subtotal (which already includes tax),
+    # then the result is returned as the total
+    expected_discounted_total = expected_subtotal * DISCOUNT_MULT
+
+    # Compare with a small tolerance due to floating point calculations
+    assert (
+        abs(discounted_total - expected_discounted_total) < 0.01
+    ), f"Discounted total should be close to {expected_discounted_total}"
+
+    # Step 5: Complete checkout
+    order = patched_checkout.process_checkout(test_user, payment_method)
+
+    # Verify order was created with correct details
+    assert order.user_id == test_user.id
+    assert order.total_price == discounted_total
+    assert order.payment_method == payment_method
+    assert order.shipping_address == TEST_ADDRESS
+
+    # Verify order items match cart items
+    assert len(order.items) == 2
+
+    # Verify cart is empty after checkout
+    assert cart.is_empty()
+
+
+def test_login_authenticates_user(user_manager):
+    """
+    Test that logging in through UserManager issues tokens and authenticates.
+    """
+    user = _register_test_user(user_manager)
+
+    logged_in, tokens = _login_user_for_test(user_manager, user)
 
-    def setUp(self):
-        """Set up test environment before each test."""
-        # Initialize components
-        self.user_db = UserDatabase()
-        self.jwt_manager = JWTManager()
-        self.user_manager = UserManager(self.user_db, self.jwt_manager)
-        self.inventory = Inventory()
-        self.order_manager = OrderManager()
-        self.checkout_system = CheckoutSystem(self.inventory, self.order_manager)
-
-        # Create a test user
-        self.test_username = f"testuser_{uuid.uuid4()}"
-        self.test_password = "Test@1234"  # Satisfies password strength requirements
-        self.test_email = f"{self.test_username}@example.com"
-        self.test_full_name = "Test User"
-        self.test_address = "123 Test Street, Test City, 12345"
-
-        # Mock the add_user method to avoid actual file operations
-        with patch.object(UserDatabase, "add_user"), patch.object(
-            UserDatabase, "username_exists", return_value=False
-        ), patch.object(UserDatabase, "email_exists", return_value=False):
-            self.test_user = self.user_manager.register_user(
-                username=self.test_username,
-                full_name=self.test_full_name,
-                email=self.test_email,
-                password=self.test_password,
-                shipping_address=self.test_address,
-            )
-
-        # Add test products to inventory
-        with patch.object(Inventory, "_save_inventory"):
-            self.chair = Chair(
-                price=100.0, material=ChairMaterial.WOOD.value, description="Test Chair"
-            )
-            self.chair_id = self.inventory.add_furniture(self.chair, quantity=10)
-
-            self.table = Table(
-                price=200.0, shape=TableShape.ROUND.value, description="Test Table"
-            )
-            self.table_id = self.inventory.add_furniture(self.table, quantity=5)
-
-        # Login the test user
-        with patch.object(
-            UserDatabase,
-            "validate_credentials",
-            return_value={
-                "id": self.test_user.id,
-                "username": self.test_username,
-                "full_name": self.test_full_name,
-                "email": self.test_email,
-                "shipping_address": self.test_address,
-            },
-        ):
-            self.test_user, self.tokens = self.user_manager.login(
-                self.test_username, self.test_password
-            )
-
-    def test_complete_purchase_flow(self):
-        """
-        Test the complete purchase flow from adding items to completing checkout.
-        """
-        # Step 1: Verify user is authenticated
-        self.assertTrue(self.test_user.is_authenticated)
-
-        # Step 2: Add items to cart
-        cart = self.test_user.shopping_cart
-        cart.add_item(self.chair, 2)
-        cart.add_item(self.table, 1)
-
-        # Verify items were added correctly
-        cart_items = cart.get_items()
-        self.assertEqual(len(cart_items), 2)
-
-        # Find chair in cart
-        chair_in_cart = None
-        table_in_cart = None
-        for item in cart_items:
-            if item[0].id == self.chair_id:
-                chair_in_cart = item
-            elif item[0].id == self.table_id:
-                table_in_cart = item
-
-        self.assertIsNotNone(chair_in_cart, "Chair should be in the cart")
-        self.assertIsNotNone(table_in_cart, "Table should be in the cart")
-        self.assertEqual(chair_in_cart[1], 2, "Should have 2 chairs in cart")
-        self.assertEqual(table_in_cart[1], 1, "Should have 1 table in cart")
-
-        # Step 3: Calculate initial cart total
-        initial_subtotal = cart.get_subtotal()
-
-        # Use TAX_RATE from application config
-        base_chair_price = 100.0
-        base_table_price = 200.0
-
-        # Chair price with tax * quantity
-        taxed_chair_price = base_chair_price * (1 + TAX_RATE) * 2
-        # Table price with tax * quantity
-        taxed_table_price = base_table_price * (1 + TAX_RATE) * 1
-
-        expected_subtotal = taxed_chair_price + taxed_table_price
-
-        self.assertAlmostEqual(initial_subtotal, expected_subtotal, places=2)
-
-        # Step 4: Apply a discount to the cart
-        discount_strategy = PercentageDiscountStrategy(10)  # 10% discount
-        cart.discount_strategy = discount_strategy
-
-        # Calculate new total and verify discount was applied
-        discounted_total = cart.get_total()
-
-        # The discount is applied to the subtotal (which already includes tax),
-        # then the result is returned as the total
-        expected_discounted_total = expected_subtotal * 0.9  # 10% off
-
-        # Compare with a small tolerance due to floating point calculations
-        self.assertLess(
-            abs(discounted_total - expected_discounted_total),
-            0.01,
-            f"Discounted total should be close to {expected_discounted_total}",
-        )
-
-        # Step 5: Complete checkout
-        with patch.object(OrderManager, "save_order", return_value=True), patch.object(
-            Inventory, "update_quantity", return_value=True
-        ), patch.object(Inventory, "get_quantity", side_effect=[10, 5]):
-            order = self.checkout_system.process_checkout(
-                self.test_user, PaymentMethod.CREDIT_CARD
-            )
-
-        # Verify order was created with correct details
-        self.assertEqual(order.user_id, self.test_user.id)
-        self.assertEqual(order.total_price, discounted_total)
-        self.assertEqual(order.payment_method, PaymentMethod.CREDIT_CARD)
-        self.assertEqual(order.shipping_address, self.test_address)
-
-        # Verify order items match cart items
-        self.assertEqual(len(order.items), 2)
-
-        # Verify cart is empty after checkout
-        self.assertTrue(cart.is_empty())
+    assert logged_in.is_authenticated
+    assert logged_in.id == user.id
+    assert logged_in.token == tokens["access_token"]
+    assert "refresh_token" in tokens
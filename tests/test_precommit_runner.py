@@ -0,0 +1,245 @@
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from tools import precommit_runner
+
+
+@pytest.fixture
+def run_calls(monkeypatch):
+    """
+    Replace subprocess.run in precommit_runner with a recorder.
+
+    Returns:
+        SimpleNamespace: ``commands`` lists every command run, in order;
+        ``returncodes`` is consumed one per call (0 once exhausted).
+    """
+    calls = SimpleNamespace(commands=[], returncodes=[])
+
+    def fake_run(cmd):
+        calls.commands.append(cmd)
+        returncode = calls.returncodes.pop(0) if calls.returncodes else 0
+        return SimpleNamespace(returncode=returncode)
+
+    monkeypatch.setattr(precommit_runner.subprocess, "run", fake_run)
+    return calls
+
+
+def run_main(monkeypatch, *argv):
+    """Run precommit_runner.main() as if invoked with the given arguments."""
+    monkeypatch.setattr(sys, "argv", ["precommit_runner.py", *argv])
+    precommit_runner.main()
+
+
+# ---------------------------
+# Tests for run_on_files
+# ---------------------------
+
+
+def test_run_on_files_batches_precommit(monkeypatch, run_calls) -> None:
+    """Test that files are split into BATCH_SIZE pre-commit runs."""
+    monkeypatch.setattr(precommit_runner, "BATCH_SIZE", 2)
+    files = ["a.py", "b.py", "c.py", "d.py", "e.py"]
+    assert precommit_runner.run_on_files(files) is True
+    assert run_calls.commands == [
+        ["pre-commit", "run", "--files", "a.py", "b.py"],
+        ["pre-commit", "run", "--files", "c.py", "d.py"],
+        ["pre-commit", "run", "--files", "e.py"],
+    ]
+
+
+def test_run_on_files_exact_batch_size(monkeypatch, run_calls) -> None:
+    """Test that a file count equal to BATCH_SIZE needs a single run."""
+    monkeypatch.setattr(precommit_runner, "BATCH_SIZE", 2)
+    precommit_runner.run_on_files(["a.py", "b.py"])
+    assert run_calls.commands == [["pre-commit", "run", "--files", "a.py", "b.py"]]
+
+
+def test_run_on_files_hook_id(run_calls) -> None:
+    """Test that the hook id goes before --files."""
+    precommit_runner.run_on_files(["a.py", "b.py"], hook_id="black")
+    assert run_calls.commands == [
+        ["pre-commit", "run", "black", "--files", "a.py", "b.py"]
+    ]
+
+
+@pytest.mark.parametrize("tool", ["black", "isort", "flake8"])
+def test_run_on_files_tool(monkeypatch, run_calls, tool) -> None:
+    """Test that --tool runs the tool itself on each batch."""
+    monkeypatch.setattr(precommit_runner, "BATCH_SIZE", 2)
+    precommit_runner.run_on_files(["a.py", "b.py", "c.py"], tool=tool)
+    assert run_calls.commands == [[tool, "a.py", "b.py"], [tool, "c.py"]]
+
+
+@pytest.mark.parametrize(
+    "returncodes, expected",
+    [([0, 0, 0], True), ([0, 1, 0], False), ([1, 0, 0], False), ([0, 0, 1], False)],
+)
+def test_run_on_files_combined_result(
+    monkeypatch, run_calls, returncodes, expected
+) -> None:
+    """Test that any failing batch fails the run, and every batch still runs."""
+    monkeypatch.setattr(precommit_runner, "BATCH_SIZE", 1)
+    run_calls.returncodes = list(returncodes)
+    assert precommit_runner.run_on_files(["a.py", "b.py", "c.py"]) is expected
+    assert len(run_calls.commands) == 3
+
+
+# ---------------------------
+# Tests for main
+# ---------------------------
+
+
+def test_main_batches_existing_files(monkeypatch, tmp_path, run_calls, capsys) -> None:
+    """Test that non-interactive mode checks the existing files in one run."""
+    first, second = tmp_path / "a.py", tmp_path / "b.py"
+    first.write_text("")
+    second.write_text("")
+    missing = tmp_path / "missing.py"
+    run_main(monkeypatch, str(first), str(missing), str(second), "--tool", "black")
+    assert run_calls.commands == [["black", str(first), str(second)]]
+    out = capsys.readouterr().out
+    assert f"Warning: File not found: {missing}" in out
+    assert "All checks passed." in out
+
+
+def test_main_reports_failure(monkeypatch, tmp_path, run_calls, capsys) -> None:
+    """Test that a failing batch is reported."""
+    path = tmp_path / "a.py"
+    path.write_text("")
+    run_calls.returncodes = [1]
+    run_main(monkeypatch, str(path))
+    assert "Some checks failed." in capsys.readouterr().out
+
+
+def test_main_no_existing_files(monkeypatch, tmp_path, run_calls, capsys) -> None:
+    """Test that nothing runs when none of the given files exist."""
+    run_main(monkeypatch, str(tmp_path / "a.py"), str(tmp_path / "b.py"))
+    assert run_calls.commands == []
+    out = capsys.readouterr().out
+    assert "No files to check." in out
+    assert "All checks passed." not in out
+
+
+# ---------------------------
+# Tests for interactive undo
+# ---------------------------
+
+
+def answer(monkeypatch, *choices):
+    """Feed the given choices to input(), one per prompt."""
+    replies = iter(choices)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(replies))
+
+
+def test_snapshot_round_trip(tmp_path) -> None:
+    """Test that snapshot returns the file's exact bytes."""
+    path = tmp_path / "a.py"
+    content = b"x = 1\r\n\xe2\x82\xac\n"
+    path.write_bytes(content)
+    assert precommit_runner.snapshot(str(path)) == content
+
+
+def test_interactive_undo_restores_file(monkeypatch, tmp_path, capsys) -> None:
+    """Test that [u] writes the original bytes back after a hook changed them."""
+    path = tmp_path / "a.py"
+    original = b"import os\r\nx  =  1\n\xe2\x82\xac\n"
+    path.write_bytes(original)
+
+    seen = []
+
+    def modifying_run(cmd):
+        # Record what each run sees; only the first run rewrites the file
+        seen.append(path.read_bytes())
+        if len(seen) == 1:
+            path.write_bytes(b"x = 1\n")
+        return SimpleNamespace(returncode=1)
+
+    monkeypatch.setattr(precommit_runner.subprocess, "run", modifying_run)
+    answer(monkeypatch, "u", "q")
+    run_main(monkeypatch, str(path), "--interactive", "--tool", "black")
+    # The re-check after undo sees the original bytes again
+    assert seen == [original, original]
+    assert path.read_bytes() == original
+    assert f"Restored original contents of {path}" in capsys.readouterr().out
+
+
+def test_interactive_undo_without_snapshot(
+    monkeypatch, tmp_path, run_calls, capsys
+) -> None:
+    """Test that [u] under --no-backup explains why nothing was restored."""
+    path = tmp_path / "a.py"
+    path.write_bytes(b"x = 1\n")
+    run_calls.returncodes = [1]
+    answer(monkeypatch, "u", "s")
+    run_main(monkeypatch, str(path), "--interactive", "--no-backup")
+    out = capsys.readouterr().out
+    assert "Nothing to undo: snapshots are off (--no-backup)" in out
+    # The file is re-checked after the message and then passes
+    assert len(run_calls.commands) == 2
+
+
+# ---------------------------
+# Tests for get_python_files
+# ---------------------------
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    """
+    Build a tree of Python files, some of which get_python_files must skip.
+
+    Returns:
+        Path: The tree's root; ``pkg/link`` is a symlink to ``real``.
+    """
+    for relative in (
+        "top.py",
+        "notes.txt",
+        "pkg/mod.py",
+        "pkg/sub/deep.py",
+        "real/target.py",
+        ".git/hook.py",
+        "pkg/.hidden/secret.py",
+        "__pycache__/cached.py",
+        "pkg/venv/lib/site.py",
+        "node_modules/pkg/index.py",
+    ):
+        path = tmp_path / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    (tmp_path / "pkg" / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+    return tmp_path
+
+
+def test_get_python_files_prunes_tree(source_tree) -> None:
+    """
+    Test that nested .py files are found, while hidden directories, SKIP_DIRS
+    and symlinked directories are not searched.
+    """
+    found = precommit_runner.get_python_files(str(source_tree))
+    # Files are yielded lazily rather than collected into a list
+    assert iter(found) is found
+    assert sorted(found) == sorted(
+        str(source_tree / relative)
+        for relative in ("top.py", "pkg/mod.py", "pkg/sub/deep.py", "real/target.py")
+    )
+
+
+def test_get_python_files_skips_unreadable_directories(
+    monkeypatch, source_tree
+) -> None:
+    """Test that a directory os.scandir cannot open is skipped, not fatal."""
+    real_scandir = precommit_runner.os.scandir
+    unreadable = str(source_tree / "pkg")
+
+    def scandir(directory):
+        if directory == unreadable:
+            raise PermissionError(directory)
+        return real_scandir(directory)
+
+    monkeypatch.setattr(precommit_runner.os, "scandir", scandir)
+    found = precommit_runner.get_python_files(str(source_tree))
+    assert sorted(found) == sorted(
+        str(source_tree / relative) for relative in ("top.py", "real/target.py")
+    )
@@ -1,8 +1,20 @@
-from unittest.mock import MagicMock, patch
+import copy
+import json
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 
 import pytest
-from flask import Flask
 
+import app.routes as routes
+from app.models.enums import (
+    BedSize,
+    ChairMaterial,
+    FurnitureSize,
+    PaymentMethod,
+    SofaColor,
+    TableShape,
+)
 from app.routes import get_authenticated_user
 from app.utils import AuthenticationError
 
@@ -11,30 +23,128 @@ from app.utils import AuthenticationError
 # =============================================================================
 
 
+# Holder read by the module-wide get_authenticated_user stand-in; see as_user
+_current_user = [None]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _authenticated_user_switch():
+    """
+    Replace app.routes.get_authenticated_user once for the whole module.
+
+    The stand-in returns whatever as_user() last set, raises it if it is an
+    exception, and falls back to the real function when nothing is set.
+    """
+    real = routes.get_authenticated_user
+
+    def current_user():
+        user = _current_user[0]
+        if user is None:
+            return real()
+        if isinstance(user, BaseException):
+            raise user
+        return user
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(routes, "get_authenticated_user", current_user)
+        yield
+
+
 @pytest.fixture
-def client():
+def as_user():
     """
-    Create and configure a new Flask app instance for each test.
+    Return a setter choosing the authenticated user for the current test.
 
-    Registers the blueprint from app.routes and sets the app to testing mode.
+    Pass a user to authenticate as it, or an exception for
+    get_authenticated_user to raise. Reset after each test.
     """
-    from flask import Flask
 
-    from app.routes import api  # assumes your blueprint is in app/routes.py
+    def set_user(user_or_exc):
+        _current_user[0] = user_or_exc
+        return user_or_exc
 
-    app = Flask(__name__)
-    app.register_blueprint(api)
-    app.config["TESTING"] = True
-    with app.test_client() as client:
-        yield client
+    yield set_user
+    _current_user[0] = None
 
 
-def dummy_user():
+@pytest.fixture
+def patch_attr(monkeypatch):
     """
-    Create a dummy user object with required attributes and a shopping cart.
+    Return a helper that swaps target.name for a MagicMock via monkeypatch.
+
+    Keyword arguments configure the mock, e.g. return_value or side_effect.
+    """
+
+    def patch(target, name, **config):
+        mock = MagicMock(**config)
+        monkeypatch.setattr(target, name, mock)
+        return mock
+
+    return patch
+
+
+@pytest.fixture(autouse=True)
+def reset_active_carts():
+    """
+    Clear the carts user_manager caches per user after each test.
+
+    The app and client are shared across the session, so this is the one piece
+    of per-user state in app.routes that could otherwise leak between tests.
+    """
+    yield
+    routes.user_manager._active_carts.clear()
+
+
+@dataclass
+class StubCart:
+    """
+    Lightweight stand-in for ShoppingCart with fixed totals.
+
+    Tests adjust the fields directly; use tracked_cart() when a test needs
+    to assert calls or inject side effects.
+    """
+
+    subtotal: float = 150.0
+    total: float = 140.0
+    item_count: int = 1
+    remove_result: bool = True
+    discount_strategy: object = None
+
+    def get_subtotal(self):
+        return self.subtotal
+
+    def get_total(self):
+        return self.total
+
+    def __len__(self):
+        return self.item_count
+
+    def add_item(self, furniture, quantity=1):
+        pass
+
+    def remove_item(self, furniture_id, quantity=None):
+        return self.remove_result
+
+    def clear(self):
+        pass
+
+
+def tracked_cart():
+    """
+    Return a call-tracking cart that delegates to a real StubCart.
 
     Returns:
-        MagicMock: A dummy user with preset attributes and shopping_cart methods.
+        MagicMock: A StubCart-spec'd mock wrapping a StubCart instance.
+    """
+    return MagicMock(spec=StubCart, wraps=StubCart())
+
+
+def _build_dummy_user():
+    """
+    Build the dummy user template with required attributes.
+
+    Returns:
+        MagicMock: A dummy user with preset attributes.
     """
     user = MagicMock()
     user.id = "user123"
@@ -43,23 +153,13 @@ def dummy_user():
     user.email = "test@example.com"
     user.shipping_address = "123 Test St"
 
-    # Set up a dummy shopping cart with required methods/attributes.
-    shopping_cart = MagicMock()
-    shopping_cart.get_subtotal.return_value = 150.0
-    shopping_cart.get_total.return_value = 140.0
-    shopping_cart.__len__.return_value = 1
-    shopping_cart.clear = MagicMock()
-    shopping_cart.add_item = MagicMock()
-    shopping_cart.remove_item = MagicMock(return_value=True)
-
-    user.shopping_cart = shopping_cart
     user.view_cart.return_value = []
     return user
 
 
-def create_dummy_furniture():
+def _build_dummy_furniture():
     """
-    Create a dummy furniture object with a to_dict() method.
+    Build the dummy furniture with a to_dict() method.
 
     Returns:
         MagicMock: A dummy furniture object.
@@ -69,33 +169,168 @@ def create_dummy_furniture():
     return furniture
 
 
+# Built once at import. dummy_user() hands out copies of the user template;
+# tests only read to_dict() from the furniture, so they all share one instance.
+_DUMMY_USER_TEMPLATE = _build_dummy_user()
+_DUMMY_FURNITURE = _build_dummy_furniture()
+
+
+def assert_error_body(response, status, message):
+    """Assert the response status and that the body is exactly the error message."""
+    assert response.status_code == status
+    assert response.json == {"error": message}
+
+
+# User for error-path tests where the route only reads the id or username.
+# Tests that never touch the user pass a bare object() instead.
+_BARE_USER = SimpleNamespace(id="user123", username="user1")
+
+
+def dummy_user():
+    """
+    Return a fresh copy of the dummy user with its own StubCart.
+
+    A deep copy is used because tests configure the user's child mocks
+    (return values, side effects), which a shallow copy would share.
+
+    Returns:
+        MagicMock: A dummy user with preset attributes and a StubCart.
+    """
+    user = copy.deepcopy(_DUMMY_USER_TEMPLATE)
+    user.shopping_cart = StubCart()
+    return user
+
+
 # =============================================================================
 # Furniture Routes Tests
 # =============================================================================
 
+_JSON = "application/json"
+
+# Fixed POST /api/furniture bodies, serialized once at import
+_CHAIR_PAYLOAD = json.dumps(
+    {
+        "name": "chair",
+        "price": 100,
+        "quantity": 2,
+        "material": "wood",
+        "description": "Comfortable chair",
+    }
+).encode()
+_SIMPLE_CHAIR_PAYLOAD = json.dumps(
+    {
+        "name": "chair",
+        "price": "100",
+        "quantity": 1,
+        "material": "wood",
+        "description": "A chair",
+    }
+).encode()
+_BAD_PRICE_PAYLOAD = json.dumps(
+    {
+        "name": "chair",
+        "price": "not-a-number",
+        "quantity": 1,
+        "material": "wood",
+        "description": "A chair",
+    }
+).encode()
+# "unknown" type with a valid description, so the route doesn't fail earlier
+# for missing fields
+_UNKNOWN_TYPE_PAYLOAD = json.dumps(
+    {
+        "name": "unknown",
+        "price": 100,
+        "quantity": 1,
+        "description": "Some description",
+    }
+).encode()
+_UNAUTHORIZED_PAYLOAD = json.dumps({"type": "chair", "price": 100}).encode()
+_EMPTY_PAYLOAD = b"{}"
+
+# Inventory methods replaced by TestFurnitureRoutes.inv
+_PATCHED_INVENTORY_METHODS = (
+    "get_all_furniture",
+    "search",
+    "get_furniture",
+    "get_quantity",
+    "add_furniture",
+    "update_quantity",
+    "remove_furniture",
+)
+
+
+def _capture_search(store, results):
+    """
+    Build a stand-in for inventory.search that records its strategy.
+
+    Args:
+        store: List each strategy passed to search is appended to
+        results: Value returned from every call
+
+    Returns:
+        A function usable in place of Inventory.search.
+    """
+
+    def search(strategy, *args, **kwargs):
+        store.append(strategy)
+        return results
+
+    return search
+
 
 class TestFurnitureRoutes:
     """Tests for the furniture-related routes."""
 
-    @patch("app.routes.inventory.get_all_furniture")
-    def test_get_all_furniture_no_filters(self, mock_get_all, client):
+    @pytest.fixture(scope="class")
+    def _inventory_mocks(self):
+        """
+        Replace the inventory methods used by the routes with MagicMocks once
+        for the whole class.
+        """
+        mocks = SimpleNamespace(
+            **{name: MagicMock() for name in _PATCHED_INVENTORY_METHODS}
+        )
+        with pytest.MonkeyPatch.context() as mp:
+            for name in _PATCHED_INVENTORY_METHODS:
+                mp.setattr(routes.inventory, name, getattr(mocks, name))
+            yield mocks
+
+    @pytest.fixture(autouse=True)
+    def inv(self, _inventory_mocks):
+        """
+        Return the inventory mocks, reset so each test starts with fresh
+        return values, side effects and call records.
+
+        Returns:
+            SimpleNamespace: The mocks, keyed by inventory method name.
+        """
+        for mock in vars(_inventory_mocks).values():
+            mock.reset_mock(return_value=True, side_effect=True)
+        return _inventory_mocks
+
+    @pytest.fixture
+    def auth_user(self, as_user):
+        """Authenticate requests as a fresh dummy user and return that user."""
+        return as_user(dummy_user())
+
+    def test_get_all_furniture_no_filters(self, inv, client):
         """
         Test GET /api/furniture without any filters.
 
         The dummy furniture is returned and the response
         should include the furniture details.
         """
-        dummy_item = {"furniture": create_dummy_furniture(), "quantity": 5}
-        mock_get_all.return_value = [dummy_item]
+        dummy_item = {"furniture": _DUMMY_FURNITURE, "quantity": 5}
+        inv.get_all_furniture.return_value = [dummy_item]
         response = client.get("/api/furniture")
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert isinstance(data, list)
         assert data[0]["name"] == "Chair"
         assert data[0]["price"] == 50
         assert data[0]["quantity"] == 5
 
-    @patch("app.routes.inventory.search")
     @pytest.mark.parametrize(
         "query,param,expected_quantity",
         [
@@ -104,7 +339,7 @@ class TestFurnitureRoutes:
         ],
     )
     def test_get_all_furniture_with_filters(
-        self, mock_search, client, query, param, expected_quantity
+        self, inv, client, query, param, expected_quantity
     ):
         """
         Test GET /api/furniture with a furniture_name filter.
@@ -112,13 +347,13 @@ class TestFurnitureRoutes:
         The mocked search returns an item with the given quantity.
         """
         dummy_item = {
-            "furniture": create_dummy_furniture(),
+            "furniture": _DUMMY_FURNITURE,
             "quantity": expected_quantity,
         }
-        mock_search.return_value = [dummy_item]
+        inv.search.return_value = [dummy_item]
         response = client.get(f"/api/furniture?{query}")
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert data[0]["quantity"] == expected_quantity
 
     def test_get_all_furniture_invalid_price(self, client):
@@ -128,512 +363,450 @@ class TestFurnitureRoutes:
         Should return a 400 status code with an appropriate error message.
         """
         response = client.get("/api/furniture?min_price=invalid&max_price=100")
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Invalid price format" in data["error"]
+        assert_error_body(response, 400, "Invalid price format")
 
-    @patch("app.routes.inventory.get_furniture")
-    @patch("app.routes.inventory.get_quantity")
-    def test_get_furniture_by_id_found(
-        self, mock_get_quantity, mock_get_furniture, client
-    ):
+    def test_get_furniture_by_id_found(self, inv, client):
         """
         Test GET /api/furniture/<furniture_id> for a furniture that exists.
 
         The endpoint should return a furniture object with its quantity.
         """
-        dummy_furniture = create_dummy_furniture()
-        mock_get_furniture.return_value = dummy_furniture
-        mock_get_quantity.return_value = 10
+        inv.get_furniture.return_value = _DUMMY_FURNITURE
+        inv.get_quantity.return_value = 10
         response = client.get("/api/furniture/123")
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert data["name"] == "Chair"
         assert data["quantity"] == 10
 
-    @patch("app.routes.inventory.get_furniture")
-    def test_get_furniture_by_id_not_found(self, mock_get_furniture, client):
+    def test_get_furniture_by_id_not_found(self, inv, client):
         """
         Test GET /api/furniture/<furniture_id> for a furniture that does not exist.
 
         The endpoint should return a 404 status code.
         """
-        mock_get_furniture.return_value = None
+        inv.get_furniture.return_value = None
         response = client.get("/api/furniture/invalid")
         assert response.status_code == 404
 
-    @patch("app.routes.inventory.search")
-    def test_get_all_furniture_min_price_only(self, mock_search, client):
+    def test_get_all_furniture_min_price_only(self, monkeypatch, client):
         """
         Test GET /api/furniture with only min_price provided.
 
         The search strategy should have min_price set and max_price as infinity.
         """
-        dummy_item = {"furniture": create_dummy_furniture(), "quantity": 2}
-        mock_search.return_value = [dummy_item]
+        captured = []
+        dummy_item = {"furniture": _DUMMY_FURNITURE, "quantity": 2}
+        monkeypatch.setattr(
+            routes.inventory, "search", _capture_search(captured, [dummy_item])
+        )
         response = client.get("/api/furniture?min_price=10")
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert isinstance(data, list)
-        args, kwargs = mock_search.call_args
-        strategy = args[0]
+        strategy = captured[0]
         assert strategy.min_price == 10.0
         assert strategy.max_price == float("inf")
 
-    @patch("app.routes.inventory.search")
-    def test_get_all_furniture_value_error(self, mock_search, client):
-        """
-        Test GET /api/furniture where inventory.search raises a ValueError.
-
-        Should return a 400 status code with the ValueError message.
-        """
-        mock_search.side_effect = ValueError("Test ValueError")
-        response = client.get("/api/furniture?furniture_name=chair")
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Test ValueError" in data["error"]
-
-    @patch("app.routes.inventory.search")
-    def test_get_all_furniture_generic_exception(self, mock_search, client):
-        """
-        Test GET /api/furniture where inventory.search raises a generic Exception.
-
-        Should return a 500 status code with the exception message.
-        """
-        mock_search.side_effect = Exception("Test Exception")
-        response = client.get("/api/furniture?furniture_name=chair")
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Test Exception" in data["error"]
-
-    @patch("app.routes.inventory.search")
-    def test_get_all_furniture_with_attribute_name(self, mock_search, client):
+    def test_get_all_furniture_with_attribute_name(self, monkeypatch, client):
         """
         Test GET /api/furniture with attribute_name & attribute_value.
         This covers the branch where attribute_name is not None.
         """
-        dummy_item = {"furniture": create_dummy_furniture(), "quantity": 2}
-        mock_search.return_value = [dummy_item]
+        captured = []
+        dummy_item = {"furniture": _DUMMY_FURNITURE, "quantity": 2}
+        monkeypatch.setattr(
+            routes.inventory, "search", _capture_search(captured, [dummy_item])
+        )
 
         # Query with ?attribute_name=material&attribute_value=wood
         response = client.get(
             "/api/furniture?attribute_name=material&attribute_value=wood"
         )
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert len(data) == 1
         assert data[0]["quantity"] == 2
 
         # Verify the search was called with the correct strategy
-        args, _ = mock_search.call_args
-        search_strategy = args[0]
+        search_strategy = captured[0]
         assert search_strategy.attribute_name == "material"
         assert search_strategy.attribute_value == "wood"
 
     # POST /api/furniture tests
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.add_furniture")
-    def test_add_furniture_valid(self, mock_add_furniture, mock_auth, client):
+    def test_add_furniture_valid(self, inv, auth_user, client):
         """
         Test POST /api/furniture with valid furniture data.
 
         Should return a 201 status code and the new furniture id.
         """
-        mock_auth.return_value = dummy_user()
-        mock_add_furniture.return_value = "furn123"
-        payload = {
-            "name": "chair",
-            "price": 100,
-            "quantity": 2,
-            "material": "wood",
-            "description": "Comfortable chair",
-        }
-        response = client.post("/api/furniture", json=payload)
+        inv.add_furniture.return_value = "furn123"
+        response = client.post(
+            "/api/furniture", data=_CHAIR_PAYLOAD, content_type=_JSON
+        )
         assert response.status_code == 201
-        data = response.get_json()
+        data = response.json
         assert data["id"] == "furn123"
         assert data["quantity"] == 2
 
-    @patch("app.routes.get_authenticated_user")
-    def test_add_furniture_missing_data(self, mock_auth, client):
+    def test_add_furniture_missing_data(self, auth_user, client):
         """
         Test POST /api/furniture with missing data.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
-        response = client.post("/api/furniture", json={})
+        response = client.post(
+            "/api/furniture", data=_EMPTY_PAYLOAD, content_type=_JSON
+        )
         assert response.status_code == 400
 
-    @patch("app.routes.get_authenticated_user")
-    def test_add_furniture_unsupported_type(self, mock_auth, client):
+    def test_add_furniture_unsupported_type(self, auth_user, client):
         """
         Test POST /api/furniture with an unsupported furniture type.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
-        # Use "name": "unknown" + a valid "description" so the route
-        # doesn't fail earlier for missing fields
-        payload = {
-            "name": "unknown",
-            "price": 100,
-            "quantity": 1,
-            "description": "Some description",
-        }
-        response = client.post("/api/furniture", json=payload)
+        response = client.post(
+            "/api/furniture", data=_UNKNOWN_TYPE_PAYLOAD, content_type=_JSON
+        )
         assert response.status_code == 400
-        data = response.get_json()
-        # Optional: check the specific error
-        assert "Unsupported furniture type: unknown" in data["error"]
+        assert response.json == {"error": "Unsupported furniture type: unknown"}
 
-    @patch(
-        "app.routes.get_authenticated_user",
-        side_effect=AuthenticationError("Unauthorized"),
-    )
-    def test_add_furniture_unauthorized(self, mock_auth, client):
+    def test_add_furniture_unauthorized(self, as_user, client):
         """
         Test POST /api/furniture when authentication fails.
 
         Should return a 401 status code.
         """
-        payload = {"type": "chair", "price": 100}
-        response = client.post("/api/furniture", json=payload)
+        as_user(AuthenticationError("Unauthorized"))
+        response = client.post(
+            "/api/furniture", data=_UNAUTHORIZED_PAYLOAD, content_type=_JSON
+        )
         assert response.status_code == 401
 
     # Specific furniture creation branches
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.add_furniture")
-    @patch("app.routes.Table")
-    def test_add_furniture_table(
-        self, mock_table, mock_add_furniture, mock_auth, client
-    ):
-        """
-        Test POST /api/furniture for adding a table.
-
-        Should return a 201 status code with table-specific attributes.
-        """
-        mock_auth.return_value = dummy_user()
-        dummy_table = MagicMock()
-        dummy_table.to_dict.return_value = {
-            "name": "Table",
-            "price": 200,
-            "description": "A round table",
-        }
-        mock_table.return_value = dummy_table
-        mock_add_furniture.return_value = "table123"
-        payload = {
-            "name": "table",
-            "price": "200",
-            "quantity": 1,
-            "shape": "round",
-            "size": "large",
-            "description": "A round table",
-        }
-        response = client.post("/api/furniture", json=payload)
-        assert response.status_code == 201
-        data = response.get_json()
-        assert data["id"] == "table123"
-        assert data["quantity"] == 1
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.add_furniture")
-    @patch("app.routes.Sofa")
-    def test_add_furniture_sofa(self, mock_sofa, mock_add_furniture, mock_auth, client):
-        """
-        Test POST /api/furniture for adding a sofa.
-
-        Should return a 201 status code with sofa-specific attributes.
-        """
-        mock_auth.return_value = dummy_user()
-        dummy_sofa = MagicMock()
-        dummy_sofa.to_dict.return_value = {
-            "name": "Sofa",
-            "price": 300,
-            "description": "A comfy sofa",
-        }
-        mock_sofa.return_value = dummy_sofa
-        mock_add_furniture.return_value = "sofa123"
-        payload = {
-            "name": "sofa",
-            "price": "300",
-            "quantity": 2,
-            "seats": "3",
-            "color": "blue",
-            "description": "A comfy sofa",
-        }
-        response = client.post("/api/furniture", json=payload)
-        assert response.status_code == 201
-        data = response.get_json()
-        assert data["id"] == "sofa123"
-        assert data["quantity"] == 2
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.add_furniture")
-    @patch("app.routes.Bed")
-    def test_add_furniture_bed(self, mock_bed, mock_add_furniture, mock_auth, client):
-        """
-        Test POST /api/furniture for adding a bed.
-
-        Should return a 201 status code with bed-specific attributes.
-        """
-        mock_auth.return_value = dummy_user()
-        dummy_bed = MagicMock()
-        dummy_bed.to_dict.return_value = {
-            "name": "Bed",
-            "price": 400,
-            "description": "A queen bed",
-        }
-        mock_bed.return_value = dummy_bed
-        mock_add_furniture.return_value = "bed123"
-        payload = {
-            "name": "bed",
-            "price": "400",
-            "quantity": 1,
-            "size": "queen",
-            "description": "A queen bed",
-        }
-        response = client.post("/api/furniture", json=payload)
-        assert response.status_code == 201
-        data = response.get_json()
-        assert data["id"] == "bed123"
-        assert data["quantity"] == 1
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.add_furniture")
-    @patch("app.routes.Bookcase")
-    def test_add_furniture_bookcase(
-        self, mock_bookcase, mock_add_furniture, mock_auth, client
+    @pytest.mark.parametrize(
+        "cls_name, payload, ret_id",
+        [
+            (
+                "Table",
+                {
+                    "name": "table",
+                    "price": "200",
+                    "quantity": 1,
+                    "shape": "round",
+                    "size": "large",
+                    "description": "A round table",
+                },
+                "table123",
+            ),
+            (
+                "Sofa",
+                {
+                    "name": "sofa",
+                    "price": "300",
+                    "quantity": 2,
+                    "seats": "3",
+                    "color": "blue",
+                    "description": "A comfy sofa",
+                },
+                "sofa123",
+            ),
+            (
+                "Bed",
+                {
+                    "name": "bed",
+                    "price": "400",
+                    "quantity": 1,
+                    "size": "queen",
+                    "description": "A queen bed",
+                },
+                "bed123",
+            ),
+            (
+                "Bookcase",
+                {
+                    "name": "bookcase",
+                    "price": "150",
+                    "quantity": 1,
+                    "shelves": "4",
+                    "size": "medium",
+                    "description": "A bookcase",
+                },
+                "bookcase123",
+            ),
+        ],
+    )
+    def test_add_furniture_types(
+        self, inv, auth_user, monkeypatch, client, cls_name, payload, ret_id
     ):
         """
-        Test POST /api/furniture for adding a bookcase.
-
-        Should return a 201 status code with bookcase-specific attributes.
-        """
-        mock_auth.return_value = dummy_user()
-        dummy_bookcase = MagicMock()
-        dummy_bookcase.to_dict.return_value = {
-            "name": "Bookcase",
-            "price": 150,
-            "description": "A bookcase",
-        }
-        mock_bookcase.return_value = dummy_bookcase
-        mock_add_furniture.return_value = "bookcase123"
-        payload = {
-            "name": "bookcase",
-            "price": "150",
-            "quantity": 1,
-            "shelves": "4",
-            "size": "medium",
-            "description": "A bookcase",
-        }
-        response = client.post("/api/furniture", json=payload)
-        assert response.status_code == 201
-        data = response.get_json()
-        assert data["id"] == "bookcase123"
-        assert data["quantity"] == 1
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.add_furniture")
-    def test_add_furniture_value_error(self, mock_add_furniture, mock_auth, client):
-        """
-        Test POST /api/furniture with non-numeric price to trigger a ValueError.
+        Test POST /api/furniture for adding a table, sofa, bed and bookcase.
 
-        Should return a 400 status code.
+        Should return a 201 status code with the new id and quantity.
         """
-        mock_auth.return_value = dummy_user()
-        payload = {
-            "name": "chair",  # changed from "type"
-            "price": "not-a-number",
-            "quantity": 1,
-            "material": "wood",
-            "description": "A chair",
-        }
-        response = client.post("/api/furniture", json=payload)
-        assert response.status_code == 400
-        data = response.get_json()
-        assert (
-            "could not convert" in data["error"] or "invalid literal" in data["error"]
+        created = SimpleNamespace(
+            to_dict=lambda d={
+                "name": cls_name,
+                "price": float(payload["price"]),
+                "description": payload["description"],
+            }: d
         )
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.add_furniture")
-    def test_add_furniture_generic_exception(
-        self, mock_add_furniture, mock_auth, client
-    ):
-        """
-        Test POST /api/furniture where add_furniture raises a generic Exception.
-
-        Should return a 500 status code.
-        """
-        mock_auth.return_value = dummy_user()
-        mock_add_furniture.side_effect = Exception("Generic error")
-        payload = {
-            "name": "chair",
-            "price": "100",
-            "quantity": 1,
-            "material": "wood",
-            "description": "A chair",
-        }
+        monkeypatch.setattr(routes, cls_name, Mock(return_value=created))
+        inv.add_furniture.return_value = ret_id
         response = client.post("/api/furniture", json=payload)
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
+        assert response.status_code == 201
+        data = response.json
+        assert data["id"] == ret_id
+        assert data["quantity"] == payload["quantity"]
 
     # PUT /api/furniture/<furniture_id> tests
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.update_quantity")
-    def test_update_furniture_quantity_success(self, mock_update, mock_auth, client):
+    def test_update_furniture_quantity_success(self, inv, auth_user, client):
         """
         Test PUT /api/furniture/<furniture_id>
         to update furniture quantity successfully.
 
         Should return a 200 status code.
         """
-        mock_auth.return_value = dummy_user()
-        mock_update.return_value = True
+        inv.update_quantity.return_value = True
         payload = {"quantity": 15}
         response = client.put("/api/furniture/123", json=payload)
         assert response.status_code == 200
 
-    @patch("app.routes.get_authenticated_user")
-    def test_update_furniture_quantity_missing(self, mock_auth, client):
+    def test_update_furniture_quantity_missing(self, auth_user, client):
         """
         Test PUT /api/furniture/<furniture_id> with missing quantity.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
         response = client.put("/api/furniture/123", json={})
         assert response.status_code == 400
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.update_quantity")
-    def test_update_furniture_quantity_not_found(self, mock_update, mock_auth, client):
+    def test_update_furniture_quantity_not_found(self, inv, auth_user, client):
         """
         Test PUT /api/furniture/<furniture_id> when the furniture is not found.
 
         Should return a 404 status code.
         """
-        mock_auth.return_value = dummy_user()
-        mock_update.return_value = False
+        inv.update_quantity.return_value = False
         payload = {"quantity": 5}
         response = client.put("/api/furniture/123", json=payload)
         assert response.status_code == 404
 
-    @patch("app.routes.get_authenticated_user")
-    def test_update_furniture_quantity_auth_error(self, mock_auth, client):
+    def test_update_furniture_quantity_auth_error(self, as_user, client):
         """
         Test PUT /api/furniture/<furniture_id> when authentication fails.
 
         Should return a 401 status code.
         """
-        mock_auth.side_effect = AuthenticationError("Auth error")
-        response = client.put("/api/furniture/123", json={"quantity": 10})
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_update_furniture_quantity_value_error(self, mock_auth, client):
-        """
-        Test PUT /api/furniture/<furniture_id> with non-numeric quantity.
-
-        Should return a 400 status code with a conversion error message.
-        """
-        mock_auth.return_value = dummy_user()
-        response = client.put("/api/furniture/123", json={"quantity": "abc"})
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "invalid literal" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.update_quantity")
-    def test_update_furniture_quantity_generic_exception(
-        self, mock_update, mock_auth, client
-    ):
-        """
-        Test PUT /api/furniture/<furniture_id>
-        where update_quantity raises a generic Exception.
-
-        Should return a 500 status code.
-        """
-        mock_auth.return_value = dummy_user()
-        mock_update.side_effect = Exception("Generic error")
+        as_user(AuthenticationError("Auth error"))
         response = client.put("/api/furniture/123", json={"quantity": 10})
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
+        assert_error_body(response, 401, "Auth error")
 
     # DELETE /api/furniture/<furniture_id> tests
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.remove_furniture")
-    def test_remove_furniture_success(self, mock_remove, mock_auth, client):
+    def test_remove_furniture_success(self, inv, auth_user, client):
         """
         Test DELETE /api/furniture/<furniture_id> for successful removal.
 
         Should return a 200 status code.
         """
-        mock_auth.return_value = dummy_user()
-        mock_remove.return_value = True
+        inv.remove_furniture.return_value = True
         response = client.delete("/api/furniture/123")
         assert response.status_code == 200
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.remove_furniture")
-    def test_remove_furniture_not_found(self, mock_remove, mock_auth, client):
+    def test_remove_furniture_not_found(self, inv, auth_user, client):
         """
         Test DELETE /api/furniture/<furniture_id> when furniture is not found.
 
         Should return a 404 status code.
         """
-        mock_auth.return_value = dummy_user()
-        mock_remove.return_value = False
+        inv.remove_furniture.return_value = False
         response = client.delete("/api/furniture/invalid")
         assert response.status_code == 404
 
-    def test_remove_furniture_auth_error(self, client, mocker):
-        """
-        Test DELETE /api/furniture/<furniture_id> when authentication fails.
+    # Error paths
 
-        Should return a 401 status code.
-        """
-        mocker.patch(
-            "app.routes.get_authenticated_user",
-            side_effect=AuthenticationError("Auth error"),
-        )
-        response = client.delete("/api/furniture/123")
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
-
-    def test_remove_furniture_generic_exception(self, client, mocker):
+    @pytest.mark.parametrize(
+        "method, path, request_kwargs, mock_attr, exc, expected_code, message",
+        [
+            pytest.param(
+                "GET",
+                "/api/furniture?furniture_name=chair",
+                {},
+                "search",
+                ValueError("Test ValueError"),
+                400,
+                "Test ValueError",
+                id="get-all-value-error",
+            ),
+            pytest.param(
+                "GET",
+                "/api/furniture?furniture_name=chair",
+                {},
+                "search",
+                Exception("Test Exception"),
+                500,
+                "Test Exception",
+                id="get-all-generic-exception",
+            ),
+            pytest.param(
+                "POST",
+                "/api/furniture",
+                {"data": _BAD_PRICE_PAYLOAD, "content_type": _JSON},
+                None,
+                None,
+                400,
+                "could not convert string to float: 'not-a-number'",
+                id="add-value-error",
+            ),
+            pytest.param(
+                "POST",
+                "/api/furniture",
+                {"data": _SIMPLE_CHAIR_PAYLOAD, "content_type": _JSON},
+                "add_furniture",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="add-generic-exception",
+            ),
+            pytest.param(
+                "PUT",
+                "/api/furniture/123",
+                {"json": {"quantity": "abc"}},
+                None,
+                None,
+                400,
+                "invalid literal for int() with base 10: 'abc'",
+                id="update-value-error",
+            ),
+            pytest.param(
+                "PUT",
+                "/api/furniture/123",
+                {"json": {"quantity": 10}},
+                "update_quantity",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="update-generic-exception",
+            ),
+            pytest.param(
+                "DELETE",
+                "/api/furniture/123",
+                {},
+                "auth",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="remove-auth-error",
+            ),
+            pytest.param(
+                "DELETE",
+                "/api/furniture/123",
+                {},
+                "remove_furniture",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="remove-generic-exception",
+            ),
+        ],
+    )
+    def test_error_paths(
+        self,
+        inv,
+        auth_user,
+        as_user,
+        client,
+        method,
+        path,
+        request_kwargs,
+        mock_attr,
+        exc,
+        expected_code,
+        message,
+    ):
         """
-        Test DELETE /api/furniture/<furniture_id>
-        where removal raises a generic Exception.
+        Test furniture routes when the request is invalid or a dependency raises.
 
-        Should return a 500 status code.
+        The mocked inventory method (or get_authenticated_user, as ``auth``)
+        raises the given exception, if any. The response should carry the
+        expected status code and error message.
         """
-        dummy = dummy_user()
-        mocker.patch("app.routes.get_authenticated_user", return_value=dummy)
-        mocker.patch(
-            "app.routes.inventory.remove_furniture",
-            side_effect=Exception("Generic error"),
-        )
-        response = client.delete("/api/furniture/123")
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
+        if mock_attr == "auth":
+            as_user(exc)
+        elif mock_attr is not None:
+            getattr(inv, mock_attr).side_effect = exc
+        response = client.open(path, method=method, **request_kwargs)
+        assert response.status_code == expected_code
+        assert response.json == {"error": message}
 
 
 # =============================================================================
 # User Routes Tests
 # =============================================================================
 
+# Request bodies shared by the user-route tests, serialized once
+_REGISTER_PAYLOAD = json.dumps(
+    {
+        "username": "user1",
+        "full_name": "User One",
+        "email": "user1@example.com",
+        "password": "password",
+        "shipping_address": "Address 1",
+    }
+).encode()
+_LOGIN_PAYLOAD = json.dumps({"username": "user1", "password": "password"}).encode()
+_REFRESH_PAYLOAD = json.dumps({"refresh_token": "rtoken"}).encode()
+_PROFILE_PAYLOAD = json.dumps(
+    {
+        "full_name": "New Name",
+        "email": "new@example.com",
+        "shipping_address": "New Address",
+    }
+).encode()
+_PASSWORD_PAYLOAD = json.dumps(
+    {"current_password": "oldpass", "new_password": "newpass"}
+).encode()
+
+
+@pytest.fixture(scope="session")
+def call_view(flask_app):
+    """
+    Return a helper that calls a view function directly in a request context.
+
+    Skips URL routing and the WSGI layer, so it suits tests that only exercise
+    a view's own request validation.
+    """
+
+    def call(view, path, method, json=None):
+        with flask_app.test_request_context(path, method=method, json=json):
+            return flask_app.make_response(view())
+
+    return call
+
+
+@pytest.fixture(scope="session")
+def user_manager_mock_template():
+    """Build an unconfigured MagicMock specced on app.routes.user_manager once."""
+    return MagicMock(spec=routes.user_manager)
+
+
+@pytest.fixture
+def user_manager_mock(user_manager_mock_template, monkeypatch):
+    """
+    Install a fresh copy of the user_manager mock on app.routes.
+
+    The template is deep-copied so return values and side effects configured
+    by one test never reach another.
+    """
+    mock = copy.deepcopy(user_manager_mock_template)
+    monkeypatch.setattr(routes, "user_manager", mock)
+    return mock
+
 
 class TestUserRoutes:
     """
@@ -641,8 +814,14 @@ class TestUserRoutes:
     (registration, login, profile, password, logout).
     """
 
-    @patch("app.routes.user_manager.register_user")
-    def test_register_user_valid(self, mock_register, client):
+    @pytest.fixture
+    def dummy(self, as_user):
+        """Authenticate requests as a dummy user named user1."""
+        dummy = dummy_user()
+        dummy.username = "user1"
+        return as_user(dummy)
+
+    def test_register_user_valid(self, user_manager_mock, client):
         """
         Test POST /api/users/register with valid user registration data.
 
@@ -654,31 +833,16 @@ class TestUserRoutes:
         dummy.full_name = "User One"
         dummy.email = "user1@example.com"
         dummy.shipping_address = "Address 1"
-        mock_register.return_value = dummy
-        payload = {
-            "username": "user1",
-            "full_name": "User One",
-            "email": "user1@example.com",
-            "password": "password",
-            "shipping_address": "Address 1",
-        }
-        response = client.post("/api/users/register", json=payload)
+        user_manager_mock.register_user.return_value = dummy
+        response = client.post(
+            "/api/users/register", data=_REGISTER_PAYLOAD, content_type=_JSON
+        )
         assert response.status_code == 201
-        data = response.get_json()
+        data = response.json
         assert data["id"] == "user1"
         assert data["username"] == "user1"
 
-    def test_register_user_missing_data(self, client):
-        """
-        Test POST /api/users/register with missing data.
-
-        Should return a 400 status code.
-        """
-        response = client.post("/api/users/register", json={})
-        assert response.status_code == 400
-
-    @patch("app.routes.user_manager.login")
-    def test_login_user_valid(self, mock_login, client):
+    def test_login_user_valid(self, user_manager_mock, client):
         """
         Test POST /api/users/login with valid credentials.
 
@@ -687,61 +851,29 @@ class TestUserRoutes:
         dummy = dummy_user()
         dummy.username = "user1"
         tokens = {"access": "token", "refresh": "rtoken"}
-        mock_login.return_value = (dummy, tokens)
-        payload = {"username": "user1", "password": "password"}
-        response = client.post("/api/users/login", json=payload)
+        user_manager_mock.login.return_value = (dummy, tokens)
+        response = client.post(
+            "/api/users/login", data=_LOGIN_PAYLOAD, content_type=_JSON
+        )
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert "user" in data and "tokens" in data
 
-    def test_login_user_missing_fields(self, client):
-        """
-        Test POST /api/users/login with missing password.
-
-        Should return a 400 status code.
-        """
-        response = client.post("/api/users/login", json={"username": "user1"})
-        assert response.status_code == 400
-
-    @patch(
-        "app.routes.user_manager.login",
-        side_effect=AuthenticationError("Invalid credentials"),
-    )
-    def test_login_user_auth_error(self, mock_login, client):
-        """
-        Test POST /api/users/login with invalid credentials.
-
-        Should return a 401 status code.
-        """
-        payload = {"username": "user1", "password": "wrong"}
-        response = client.post("/api/users/login", json=payload)
-        assert response.status_code == 401
-
-    @patch("app.routes.user_manager.refresh_access_token")
-    def test_refresh_token_valid(self, mock_refresh, client):
+    def test_refresh_token_valid(self, user_manager_mock, client):
         """
         Test POST /api/users/refresh-token with a valid refresh token.
 
         Should return a 200 status code and the new access token.
         """
-        mock_refresh.return_value = "newtoken"
-        payload = {"refresh_token": "rtoken"}
-        response = client.post("/api/users/refresh-token", json=payload)
+        user_manager_mock.refresh_access_token.return_value = "newtoken"
+        response = client.post(
+            "/api/users/refresh-token", data=_REFRESH_PAYLOAD, content_type=_JSON
+        )
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert data["access_token"] == "newtoken"
 
-    def test_refresh_token_missing(self, client):
-        """
-        Test POST /api/users/refresh-token with missing data.
-
-        Should return a 400 status code.
-        """
-        response = client.post("/api/users/refresh-token", json={})
-        assert response.status_code == 400
-
-    @patch("app.routes.get_authenticated_user")
-    def test_get_user_profile(self, mock_auth, client):
+    def test_get_user_profile(self, client, as_user):
         """
         Test GET /api/users/profile with a valid user.
 
@@ -753,348 +885,70 @@ class TestUserRoutes:
         dummy.full_name = "User One"
         dummy.email = "user1@example.com"
         dummy.shipping_address = "Address 1"
-        mock_auth.return_value = dummy
+        as_user(dummy)
         response = client.get("/api/users/profile")
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert data["id"] == "user1"
 
-    @patch(
-        "app.routes.get_authenticated_user",
-        side_effect=AuthenticationError("Unauthorized"),
-    )
-    def test_get_user_profile_unauthorized(self, mock_auth, client):
-        """
-        Test GET /api/users/profile when authentication fails.
-
-        Should return a 401 status code.
-        """
-        response = client.get("/api/users/profile")
-        assert response.status_code == 401
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.user_manager.update_user")
-    def test_update_user_profile_success(self, mock_update, mock_auth, client):
+    def test_update_user_profile_success(self, user_manager_mock, client, dummy):
         """
         Test PUT /api/users/profile for successful profile update.
 
         Should return a 200 status code.
         """
-        dummy = dummy_user()
-        dummy.username = "user1"
-        mock_auth.return_value = dummy
-        mock_update.return_value = True
-        payload = {
-            "full_name": "New Name",
-            "email": "new@example.com",
-            "shipping_address": "New Address",
-        }
-        response = client.put("/api/users/profile", json=payload)
-        assert response.status_code == 200
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.user_manager.update_user")
-    def test_update_user_profile_failure(self, mock_update, mock_auth, client):
-        """
-        Test PUT /api/users/profile when profile update fails.
-
-        Should return a 400 status code.
-        """
-        dummy = dummy_user()
-        dummy.username = "user1"
-        mock_auth.return_value = dummy
-        mock_update.return_value = False
-        payload = {"full_name": "New Name"}
-        response = client.put("/api/users/profile", json=payload)
-        assert response.status_code == 400
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.user_manager.update_password")
-    def test_update_password_success(self, mock_update, mock_auth, client):
-        """
-        Test PUT /api/users/password for a successful password update.
-
-        Should return a 200 status code.
-        """
-        dummy = dummy_user()
-        dummy.username = "user1"
-        mock_auth.return_value = dummy
-        mock_update.return_value = True
-        payload = {"current_password": "old", "new_password": "new"}
-        response = client.put("/api/users/password", json=payload)
-        assert response.status_code == 200
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.user_manager.update_password")
-    def test_update_password_failure(self, mock_update, mock_auth, client):
-        """
-        Test PUT /api/users/password when password update fails.
-
-        Should return a 400 status code.
-        """
-        dummy = dummy_user()
-        dummy.username = "user1"
-        mock_auth.return_value = dummy
-        mock_update.return_value = False
-        payload = {"current_password": "old", "new_password": "new"}
-        response = client.put("/api/users/password", json=payload)
-        assert response.status_code == 400
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.user_manager.logout")
-    def test_logout_user(self, mock_logout, mock_auth, client):
-        """
-        Test POST /api/users/logout for successful logout.
-
-        Should return a 200 status code.
-        """
-        dummy = dummy_user()
-        mock_auth.return_value = dummy
-        response = client.post("/api/users/logout")
-        assert response.status_code == 200
-
-    @patch("app.routes.get_authenticated_user")
-    def test_update_password_auth_error(self, mock_auth, client):
-        """
-        Test PUT /api/users/password when authentication fails.
-
-        Should return a 401 status code.
-        """
-        mock_auth.side_effect = AuthenticationError("Auth error")
-        payload = {"current_password": "oldpass", "new_password": "newpass"}
-        response = client.put("/api/users/password", json=payload)
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.user_manager.update_password")
-    def test_update_password_value_error(self, mock_update, mock_auth, client):
-        """
-        Test PUT /api/users/password where update_password raises a ValueError.
-
-        Should return a 400 status code.
-        """
-        mock_auth.return_value = dummy_user()
-        mock_update.side_effect = ValueError("Test ValueError")
-        payload = {"current_password": "oldpass", "new_password": "newpass"}
-        response = client.put("/api/users/password", json=payload)
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Test ValueError" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.user_manager.update_password")
-    def test_update_password_generic_exception(self, mock_update, mock_auth, client):
-        """
-        Test PUT /api/users/password where update_password raises a generic Exception.
-
-        Should return a 500 status code.
-        """
-        mock_auth.return_value = dummy_user()
-        mock_update.side_effect = Exception("Generic error")
-        payload = {"current_password": "oldpass", "new_password": "newpass"}
-        response = client.put("/api/users/password", json=payload)
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_update_user_profile_auth_error(self, mock_auth, client):
-        """
-        Test PUT /api/users/profile when authentication fails.
-
-        Should return a 401 status code.
-        """
-        mock_auth.side_effect = AuthenticationError("Auth error")
-        payload = {
-            "full_name": "New Name",
-            "email": "new@example.com",
-            "shipping_address": "New Address",
-        }
-        response = client.put("/api/users/profile", json=payload)
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.user_manager.update_user")
-    def test_update_user_profile_value_error(self, mock_update, mock_auth, client):
-        """
-        Test PUT /api/users/profile where update_user raises a ValueError.
-
-        Should return a 400 status code.
-        """
-        mock_auth.return_value = dummy_user()
-        mock_update.side_effect = ValueError("Test ValueError")
-        payload = {
-            "full_name": "New Name",
-            "email": "new@example.com",
-            "shipping_address": "New Address",
-        }
-        response = client.put("/api/users/profile", json=payload)
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Test ValueError" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.user_manager.update_user")
-    def test_update_user_profile_generic_exception(
-        self, mock_update, mock_auth, client
-    ):
-        """
-        Test PUT /api/users/profile where update_user raises a generic Exception.
-
-        Should return a 500 status code.
-        """
-        mock_auth.return_value = dummy_user()
-        mock_update.side_effect = Exception("Generic error")
-        payload = {
-            "full_name": "New Name",
-            "email": "new@example.com",
-            "shipping_address": "New Address",
-        }
-        response = client.put("/api/users/profile", json=payload)
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_logout_user_auth_error(self, mock_auth, client):
-        """
-        Test POST /api/users/logout when authentication fails.
-
-        Should return a 401 status code.
-        """
-        mock_auth.side_effect = AuthenticationError("Auth error")
-        response = client.post("/api/users/logout")
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.user_manager.logout")
-    def test_logout_user_generic_exception(self, mock_logout, mock_auth, client):
-        """
-        Test POST /api/users/logout where logout raises a generic Exception.
-
-        Should return a 500 status code.
-        """
-        mock_auth.return_value = dummy_user()
-        mock_logout.side_effect = Exception("Generic error")
-        response = client.post("/api/users/logout")
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
-
-    @patch("app.routes.user_manager.refresh_access_token")
-    def test_refresh_token_auth_error(self, mock_refresh, client):
-        """
-        Test POST /api/users/refresh-token when refresh_access_token
-        raises AuthenticationError.
-
-        Should return a 401 status code.
-        """
-        payload = {"refresh_token": "sometoken"}
-        mock_refresh.side_effect = AuthenticationError("Auth error")
-        response = client.post("/api/users/refresh-token", json=payload)
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
-
-    @patch("app.routes.user_manager.refresh_access_token")
-    def test_refresh_token_generic_exception(self, mock_refresh, client):
-        """
-        Test POST /api/users/refresh-token when refresh_access_token
-        raises a generic Exception.
-
-        Should return a 500 status code.
-        """
-        payload = {"refresh_token": "sometoken"}
-        mock_refresh.side_effect = Exception("Generic error")
-        response = client.post("/api/users/refresh-token", json=payload)
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
-
-    @patch("app.routes.user_manager.register_user")
-    def test_register_user_value_error(self, mock_register, client):
-        """
-        Test POST /api/users/register when register_user raises a ValueError.
-
-        Should return a 400 status code.
-        """
-        mock_register.side_effect = ValueError("Test ValueError")
-        payload = {
-            "username": "user1",
-            "full_name": "User One",
-            "email": "user1@example.com",
-            "password": "password",
-            "shipping_address": "Address 1",
-        }
-        response = client.post("/api/users/register", json=payload)
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Test ValueError" in data["error"]
+        user_manager_mock.update_user.return_value = True
+        response = client.put(
+            "/api/users/profile", data=_PROFILE_PAYLOAD, content_type=_JSON
+        )
+        assert response.status_code == 200
 
-    @patch("app.routes.user_manager.register_user")
-    def test_register_user_generic_exception(self, mock_register, client):
+    def test_update_user_profile_failure(self, user_manager_mock, client, dummy):
         """
-        Test POST /api/users/register when register_user raises a generic Exception.
+        Test PUT /api/users/profile when profile update fails.
 
-        Should return a 500 status code.
+        Should return a 400 status code.
         """
-        mock_register.side_effect = Exception("Generic error")
-        payload = {
-            "username": "user1",
-            "full_name": "User One",
-            "email": "user1@example.com",
-            "password": "password",
-            "shipping_address": "Address 1",
-        }
-        response = client.post("/api/users/register", json=payload)
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
+        user_manager_mock.update_user.return_value = False
+        response = client.put(
+            "/api/users/profile", data=_PROFILE_PAYLOAD, content_type=_JSON
+        )
+        assert response.status_code == 400
 
-    @patch("app.routes.user_manager.login")
-    def test_login_user_generic_exception(self, mock_login, client):
+    def test_update_password_success(self, user_manager_mock, client, dummy):
         """
-        Test POST /api/users/login when login raises a generic Exception.
+        Test PUT /api/users/password for a successful password update.
 
-        Should return a 500 status code.
+        Should return a 200 status code.
         """
-        mock_login.side_effect = Exception("Generic error")
-        payload = {"username": "user1", "password": "pass"}
-        response = client.post("/api/users/login", json=payload)
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
+        user_manager_mock.update_password.return_value = True
+        response = client.put(
+            "/api/users/password", data=_PASSWORD_PAYLOAD, content_type=_JSON
+        )
+        assert response.status_code == 200
 
-    def test_login_user_no_data(self, client):
+    def test_update_password_failure(self, user_manager_mock, client, dummy):
         """
-        Test POST /api/users/login with no data provided.
+        Test PUT /api/users/password when password update fails.
 
-        Should return a 400 status code with an error message.
+        Should return a 400 status code.
         """
-        response = client.post("/api/users/login", json={})
+        user_manager_mock.update_password.return_value = False
+        response = client.put(
+            "/api/users/password", data=_PASSWORD_PAYLOAD, content_type=_JSON
+        )
         assert response.status_code == 400
-        data = response.get_json()
-        assert "No data provided" in data["error"]
 
-    def test_register_user_missing_required_fields(self, client):
+    def test_logout_user(self, user_manager_mock, client, dummy):
         """
-        Test POST /api/users/register with missing required fields.
+        Test POST /api/users/logout for successful logout.
 
-        Should return a 400 status code.
+        Should return a 200 status code.
         """
-        payload = {"username": "user1"}
-        response = client.post("/api/users/register", json=payload)
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Missing required fields" in data["error"]
+        response = client.post("/api/users/logout")
+        assert response.status_code == 200
 
-    def test_get_user_profile_generic_exception(self, client, mocker):
+    def test_get_user_profile_generic_exception(self, client, as_user):
         """
         Test GET /api/users/profile where an exception
         occurs while accessing user attributes.
@@ -1112,59 +966,283 @@ class TestUserRoutes:
             def id(self):
                 raise Exception("Generic error")
 
-        mocker.patch("app.routes.get_authenticated_user", return_value=ErrorUser())
+        as_user(ErrorUser())
         response = client.get("/api/users/profile")
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_update_password_no_data(self, mock_auth, client):
-        """
-        Test PUT /api/users/password with no JSON data provided.
-
-        Should return a 400 status code.
-        """
-        mock_auth.return_value = dummy_user()
-        response = client.put("/api/users/password", json={})
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "No data provided" in data["error"]
+        assert_error_body(response, 500, "Generic error")
 
-    @patch("app.routes.get_authenticated_user")
-    def test_update_password_missing_fields(self, mock_auth, client):
+    @pytest.mark.parametrize(
+        "view, method, path, payload, expected_error",
+        [
+            pytest.param(
+                "register_user",
+                "POST",
+                "/api/users/register",
+                {},
+                "No data provided",
+                id="register-no-data",
+            ),
+            pytest.param(
+                "register_user",
+                "POST",
+                "/api/users/register",
+                {"username": "user1"},
+                "Missing required fields",
+                id="register-missing-fields",
+            ),
+            pytest.param(
+                "login_user",
+                "POST",
+                "/api/users/login",
+                {},
+                "No data provided",
+                id="login-no-data",
+            ),
+            pytest.param(
+                "login_user",
+                "POST",
+                "/api/users/login",
+                {"username": "user1"},
+                "Missing username/email or password",
+                id="login-missing-password",
+            ),
+            pytest.param(
+                "refresh_token",
+                "POST",
+                "/api/users/refresh-token",
+                {},
+                "No refresh token provided",
+                id="refresh-missing-token",
+            ),
+            pytest.param(
+                "update_user_profile",
+                "PUT",
+                "/api/users/profile",
+                {},
+                "No data provided",
+                id="update-profile-no-data",
+            ),
+            pytest.param(
+                "update_password",
+                "PUT",
+                "/api/users/password",
+                {},
+                "No data provided",
+                id="update-password-no-data",
+            ),
+            pytest.param(
+                "update_password",
+                "PUT",
+                "/api/users/password",
+                {"new_password": "newpass"},
+                "Missing current or new password",
+                id="update-password-missing-current",
+            ),
+            pytest.param(
+                "update_password",
+                "PUT",
+                "/api/users/password",
+                {"current_password": "oldpass"},
+                "Missing current or new password",
+                id="update-password-missing-new",
+            ),
+        ],
+    )
+    def test_validation_400(
+        self, call_view, as_user, view, method, path, payload, expected_error
+    ):
         """
-        Test PUT /api/users/password with missing current or new password fields.
+        Test that user routes reject missing or incomplete request data.
 
-        Should return a 400 status code.
+        Should return a 400 status code with the matching error message.
         """
-        mock_auth.return_value = dummy_user()
-        # Missing current_password.
-        response = client.put("/api/users/password", json={"new_password": "newpass"})
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Missing current or new password" in data["error"]
+        as_user(object())
+        response = call_view(getattr(routes, view), path, method, json=payload)
+        assert_error_body(response, 400, expected_error)
 
-        # Missing new_password.
-        response = client.put(
-            "/api/users/password", json={"current_password": "oldpass"}
-        )
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Missing current or new password" in data["error"]
+    # Error paths
 
-    @patch("app.routes.get_authenticated_user")
-    def test_update_user_profile_no_data(self, mock_auth, client):
+    @pytest.mark.parametrize(
+        "method, path, payload, target, exc, expected_code, message",
+        [
+            pytest.param(
+                "POST",
+                "/api/users/login",
+                _LOGIN_PAYLOAD,
+                "login",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="login-auth-error",
+            ),
+            pytest.param(
+                "POST",
+                "/api/users/login",
+                _LOGIN_PAYLOAD,
+                "login",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="login-generic-exception",
+            ),
+            pytest.param(
+                "POST",
+                "/api/users/refresh-token",
+                _REFRESH_PAYLOAD,
+                "refresh_access_token",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="refresh-auth-error",
+            ),
+            pytest.param(
+                "POST",
+                "/api/users/refresh-token",
+                _REFRESH_PAYLOAD,
+                "refresh_access_token",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="refresh-generic-exception",
+            ),
+            pytest.param(
+                "POST",
+                "/api/users/register",
+                _REGISTER_PAYLOAD,
+                "register_user",
+                ValueError("Test ValueError"),
+                400,
+                "Test ValueError",
+                id="register-value-error",
+            ),
+            pytest.param(
+                "POST",
+                "/api/users/register",
+                _REGISTER_PAYLOAD,
+                "register_user",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="register-generic-exception",
+            ),
+            pytest.param(
+                "GET",
+                "/api/users/profile",
+                None,
+                "auth",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="get-profile-auth-error",
+            ),
+            pytest.param(
+                "PUT",
+                "/api/users/profile",
+                _PROFILE_PAYLOAD,
+                "auth",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="update-profile-auth-error",
+            ),
+            pytest.param(
+                "PUT",
+                "/api/users/profile",
+                _PROFILE_PAYLOAD,
+                "update_user",
+                ValueError("Test ValueError"),
+                400,
+                "Test ValueError",
+                id="update-profile-value-error",
+            ),
+            pytest.param(
+                "PUT",
+                "/api/users/profile",
+                _PROFILE_PAYLOAD,
+                "update_user",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="update-profile-generic-exception",
+            ),
+            pytest.param(
+                "PUT",
+                "/api/users/password",
+                _PASSWORD_PAYLOAD,
+                "auth",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="update-password-auth-error",
+            ),
+            pytest.param(
+                "PUT",
+                "/api/users/password",
+                _PASSWORD_PAYLOAD,
+                "update_password",
+                ValueError("Test ValueError"),
+                400,
+                "Test ValueError",
+                id="update-password-value-error",
+            ),
+            pytest.param(
+                "PUT",
+                "/api/users/password",
+                _PASSWORD_PAYLOAD,
+                "update_password",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="update-password-generic-exception",
+            ),
+            pytest.param(
+                "POST",
+                "/api/users/logout",
+                None,
+                "auth",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="logout-auth-error",
+            ),
+            pytest.param(
+                "POST",
+                "/api/users/logout",
+                None,
+                "logout",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="logout-generic-exception",
+            ),
+        ],
+    )
+    def test_route_error_mapping(
+        self,
+        user_manager_mock,
+        as_user,
+        client,
+        method,
+        path,
+        payload,
+        target,
+        exc,
+        expected_code,
+        message,
+    ):
         """
-        Test PUT /api/users/profile with no data provided.
+        Test that exceptions raised while handling user routes map to the
+        right HTTP status and error message.
 
-        Should return a 400 status code.
+        target is either "auth" (get_authenticated_user raises exc) or the
+        name of the user_manager method that raises it.
         """
-        mock_auth.return_value = dummy_user()
-        response = client.put("/api/users/profile", json={})
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "No data provided" in data["error"]
+        if target == "auth":
+            as_user(exc)
+        else:
+            as_user(_BARE_USER)
+            setattr(user_manager_mock, target, MagicMock(side_effect=exc))
+        response = client.open(path, method=method, data=payload, content_type=_JSON)
+        assert_error_body(response, expected_code, message)
 
 
 # =============================================================================
@@ -1172,105 +1250,93 @@ class TestUserRoutes:
 # =============================================================================
 
 
+# JSON bodies shared by the cart and checkout tests; requests only read them
+_ADD_ITEM_JSON = {"furniture_id": "furn1", "quantity": 1}
+_FIND_CHAIR_JSON = {"name": "chair", "quantity": 1, "color": "red"}
+_CHECKOUT_JSON = {"payment_method": "CreditCard"}
+
+
 class TestCartRoutes:
     """Tests for the shopping cart related routes."""
 
-    @patch("app.routes.get_authenticated_user")
-    def test_get_cart(self, mock_auth, client):
+    @pytest.fixture(autouse=True)
+    def dummy(self, as_user):
+        """Authenticate every request as a fresh dummy user by default."""
+        return as_user(dummy_user())
+
+    def test_get_cart(self, client, dummy):
         """
         Test GET /api/cart returns the current user's cart details.
 
         Validates the presence of items, subtotal, total, and item_count.
         """
-        dummy = dummy_user()
-        dummy.shopping_cart.get_subtotal.return_value = 150.0
-        dummy.shopping_cart.get_total.return_value = 140.0
-        dummy.shopping_cart.__len__.return_value = 1
-        dummy.view_cart.return_value = [(create_dummy_furniture(), 2)]
-        mock_auth.return_value = dummy
+        dummy.shopping_cart = StubCart(subtotal=150.0, total=140.0, item_count=1)
+        dummy.view_cart.return_value = [(_DUMMY_FURNITURE, 2)]
         response = client.get("/api/cart")
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert "items" in data
         assert data["subtotal"] == 150.0
         assert data["total"] == 140.0
         assert data["item_count"] == 1
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.get_furniture")
-    def test_add_to_cart_success(self, mock_get_furniture, mock_auth, client):
+    def test_add_to_cart_success(self, client, dummy, patch_attr):
         """
         Test POST /api/cart/add successfully adds an item to the cart.
 
         Validates that the furniture is found and added with the specified quantity.
         """
-        dummy = dummy_user()
-        mock_auth.return_value = dummy
-        furniture = create_dummy_furniture()
-        mock_get_furniture.return_value = furniture
+        patch_attr(routes.inventory, "get_furniture", return_value=_DUMMY_FURNITURE)
+        dummy.shopping_cart = tracked_cart()
         payload = {"furniture_id": "furn1", "quantity": 3}
         response = client.post("/api/cart/add", json=payload)
         assert response.status_code == 200
-        dummy.shopping_cart.add_item.assert_called_with(furniture, 3)
+        dummy.shopping_cart.add_item.assert_called_with(_DUMMY_FURNITURE, 3)
 
-    @patch("app.routes.get_authenticated_user")
-    def test_add_to_cart_missing_id(self, mock_auth, client):
+    def test_add_to_cart_missing_id(self, client):
         """
         Test POST /api/cart/add with missing furniture_id.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
         response = client.post("/api/cart/add", json={"quantity": 2})
         assert response.status_code == 400
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.inventory.get_furniture")
-    def test_add_to_cart_not_found(self, mock_get_furniture, mock_auth, client):
+    def test_add_to_cart_not_found(self, client, patch_attr):
         """
         Test POST /api/cart/add when the furniture is not found.
 
         Should return a 404 status code.
         """
-        mock_auth.return_value = dummy_user()
-        mock_get_furniture.return_value = None
+        patch_attr(routes.inventory, "get_furniture", return_value=None)
         payload = {"furniture_id": "nonexistent", "quantity": 1}
         response = client.post("/api/cart/add", json=payload)
         assert response.status_code == 404
 
-    @pytest.mark.parametrize("description_keyword", [None, "outdoor"])
-    @patch("app.routes.cart_locator.find_and_add_to_cart")
-    @patch("app.routes.get_authenticated_user")
+    @pytest.mark.parametrize(
+        "payload, expected_kwargs",
+        [
+            pytest.param(_FIND_CHAIR_JSON, {"color": "red"}, id="no-keyword"),
+            pytest.param(
+                {**_FIND_CHAIR_JSON, "description_keyword": "outdoor"},
+                {"color": "red", "description_keyword": "outdoor"},
+                id="with-keyword",
+            ),
+        ],
+    )
     def test_find_and_add_to_cart_success(
-        self, mock_get_user, mock_find_and_add, client, description_keyword
+        self, client, dummy, patch_attr, payload, expected_kwargs
     ):
         """
         Test POST /api/cart/find-and-add successfully
         finds and adds an item to the cart.
 
-        Parametrized to handle both:
-        - description_keyword=None (not provided)
-        - description_keyword="outdoor" (provided)
+        Parametrized with and without a description_keyword; the optional
+        fields should be passed through to find_and_add_to_cart as kwargs.
         """
-        dummy = dummy_user()
-        mock_get_user.return_value = dummy
-
-        payload = {"name": "chair", "quantity": 1, "color": "red"}
-
-        # If we want to test the route's "kwargs['description_keyword']" line,
-        # we add "description_keyword" only if it's not None.
-        if description_keyword is not None:
-            payload["description_keyword"] = description_keyword
-
+        mock_find_and_add = patch_attr(routes.cart_locator, "find_and_add_to_cart")
         response = client.post("/api/cart/find-and-add", json=payload)
         assert response.status_code == 200
-
-        # Build expected kwargs for the assertion
-        expected_kwargs = {"color": "red"}
-        if description_keyword is not None:
-            expected_kwargs["description_keyword"] = description_keyword
-
-        # Now we check that the call matches exactly
         mock_find_and_add.assert_called_with(
             dummy.shopping_cart,
             "chair",  # furniture_type
@@ -1278,588 +1344,492 @@ class TestCartRoutes:
             **expected_kwargs,
         )
 
-    @patch("app.routes.get_authenticated_user")
-    def test_find_and_add_to_cart_missing_type(self, mock_auth, client):
+    def test_find_and_add_to_cart_missing_type(self, client):
         """
         Test POST /api/cart/find-and-add with missing furniture type.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
         response = client.post("/api/cart/find-and-add", json={"quantity": 1})
         assert response.status_code == 400
 
-    @patch("app.routes.get_authenticated_user")
-    def test_remove_from_cart_success(self, mock_auth, client):
+    def test_remove_from_cart_success(self, client, dummy):
         """
         Test DELETE /api/cart/remove/<furniture_id> successfully removes an item.
 
         Should call remove_item on the shopping cart.
         """
-        dummy = dummy_user()
-        dummy.shopping_cart.remove_item.return_value = True
-        mock_auth.return_value = dummy
+        dummy.shopping_cart = tracked_cart()
         response = client.delete("/api/cart/remove/furn1?quantity=2")
         assert response.status_code == 200
         dummy.shopping_cart.remove_item.assert_called_with("furn1", 2)
 
-    @patch("app.routes.get_authenticated_user")
-    def test_remove_from_cart_not_found(self, mock_auth, client):
+    def test_remove_from_cart_not_found(self, client, dummy):
         """
         Test DELETE /api/cart/remove/<furniture_id> when item removal fails.
 
         Should return a 404 status code.
         """
-        dummy = dummy_user()
-        dummy.shopping_cart.remove_item.return_value = False
-        mock_auth.return_value = dummy
+        dummy.shopping_cart.remove_result = False
         response = client.delete("/api/cart/remove/furn1")
         assert response.status_code == 404
 
-    @patch("app.routes.get_authenticated_user")
-    def test_clear_cart(self, mock_auth, client):
+    def test_clear_cart(self, client, dummy):
         """
         Test DELETE /api/cart/clear successfully clears the cart.
 
         Should call the clear method on the shopping cart.
         """
-        dummy = dummy_user()
-        mock_auth.return_value = dummy
+        dummy.shopping_cart = tracked_cart()
         response = client.delete("/api/cart/clear")
         assert response.status_code == 200
         dummy.shopping_cart.clear.assert_called()
 
-    @patch("app.routes.get_authenticated_user")
-    def test_apply_discount_percentage(self, mock_auth, client):
+    def test_apply_discount_percentage(self, client, dummy):
         """
         Test POST /api/cart/discount applying a percentage discount.
 
         Validates that the discount amount is returned.
         """
-        dummy = dummy_user()
-        dummy.shopping_cart.get_subtotal.return_value = 200
-        dummy.shopping_cart.get_total.return_value = 180
-        mock_auth.return_value = dummy
+        dummy.shopping_cart = StubCart(subtotal=200, total=180)
 
         # FIX: use "discountstrategy" to match the route
         payload = {"discountstrategy": "percentage", "value": 10}
 
         response = client.post("/api/cart/discount", json=payload)
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert "discount_amount" in data
 
-    @patch("app.routes.get_authenticated_user")
-    def test_apply_discount_fixed(self, mock_auth, client):
+    def test_apply_discount_fixed(self, client, dummy):
         """
         Test POST /api/cart/discount applying a fixed discount.
 
         Validates that the discount amount matches the fixed value.
         """
-        dummy = dummy_user()
-        dummy.shopping_cart.get_subtotal.return_value = 200
-        dummy.shopping_cart.get_total.return_value = 150
-        mock_auth.return_value = dummy
+        dummy.shopping_cart = StubCart(subtotal=200, total=150)
         payload = {"discountstrategy": "fixed", "value": 50}
         response = client.post("/api/cart/discount", json=payload)
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert data["discount_amount"] == 50
 
-    @patch("app.routes.get_authenticated_user")
-    def test_apply_discount_invalid_type(self, mock_auth, client):
+    def test_apply_discount_invalid_type(self, client):
         """
         Test POST /api/cart/discount with an invalid discount type.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
         payload = {"discountstrategy": "invalid", "value": 10}
         response = client.post("/api/cart/discount", json=payload)
         assert response.status_code == 400
 
-    @patch("app.routes.get_authenticated_user")
-    def test_apply_discount_no_data(self, mock_auth, client):
+    def test_apply_discount_no_data(self, client):
         """
         Test POST /api/cart/discount with no data provided.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
         response = client.post("/api/cart/discount", json={})
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "No data provided" in data["error"]
+        assert_error_body(response, 400, "No data provided")
 
-    @patch("app.routes.get_authenticated_user")
-    def test_apply_discount_missing_fields(self, mock_auth, client):
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param({"value": 10}, id="missing-type"),
+            pytest.param({"type": "fixed"}, id="missing-value"),
+        ],
+    )
+    def test_apply_discount_missing_fields(self, client, payload):
         """
         Test POST /api/cart/discount with missing discount type or value.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
-        # Missing discount type.
-        response = client.post("/api/cart/discount", json={"value": 10})
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Missing discount type or value" in data["error"]
-
-        # Missing discount value.
-        response = client.post("/api/cart/discount", json={"type": "fixed"})
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Missing discount type or value" in data["error"]
-
-    # Exception branches for /cart/add /cart/find-and-add,
-    # /cart/remove, /cart/clear, /cart/discount
-
-    @patch("app.routes.get_authenticated_user")
-    def test_add_to_cart_auth_error(self, mock_auth, client):
-        """
-        Test POST /api/cart/add when authentication fails.
-
-        Should return a 401 status code.
-        """
-        mock_auth.side_effect = AuthenticationError("Auth error")
-        payload = {"furniture_id": "furn1", "quantity": 1}
-        response = client.post("/api/cart/add", json=payload)
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_add_to_cart_value_error(self, mock_auth, client):
-        """
-        Test POST /api/cart/add with non-numeric quantity causing a ValueError.
-
-        Should return a 400 status code.
-        """
-        mock_auth.return_value = dummy_user()
-        payload = {"furniture_id": "furn1", "quantity": "non-numeric"}
-        response = client.post("/api/cart/add", json=payload)
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "invalid literal" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_add_to_cart_generic_exception(self, mock_auth, client):
-        """
-        Test POST /api/cart/add where a generic exception is raised.
-
-        Should return a 500 status code.
-        """
-        dummy = dummy_user()
-        mock_auth.return_value = dummy
-        from app.routes import inventory
-
-        with patch.object(
-            inventory, "get_furniture", side_effect=Exception("Generic error")
-        ):
-            payload = {"furniture_id": "furn1", "quantity": 1}
-            response = client.post("/api/cart/add", json=payload)
-            assert response.status_code == 500
-            data = response.get_json()
-            assert "Generic error" in data["error"]
+        response = client.post("/api/cart/discount", json=payload)
+        assert_error_body(response, 400, "Missing discount type or value")
 
-    @patch("app.routes.get_authenticated_user")
-    def test_find_and_add_no_data(self, mock_auth, client):
+    def test_find_and_add_no_data(self, client):
         """
         Test POST /api/cart/find-and-add with no data provided.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
         response = client.post("/api/cart/find-and-add", json={})
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "No data provided" in data["error"]
+        assert_error_body(response, 400, "No data provided")
 
-    @patch("app.routes.get_authenticated_user")
-    def test_find_and_add_missing_type(self, mock_auth, client):
+    def test_find_and_add_missing_type(self, client):
         """
         Test POST /api/cart/find-and-add with missing furniture type.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
         payload = {"quantity": 1, "color": "red"}
         response = client.post("/api/cart/find-and-add", json=payload)
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Missing furniture type" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_find_and_add_auth_error(self, mock_auth, client):
-        """
-        Test POST /api/cart/find-and-add when authentication fails.
-
-        Should return a 401 status code.
-        """
-        mock_auth.side_effect = AuthenticationError("Auth error")
-        payload = {"type": "chair", "quantity": 1}
-        response = client.post("/api/cart/find-and-add", json=payload)
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_find_and_add_value_error(self, mock_auth, client):
-        """
-        Test POST /api/cart/find-and-add with non-numeric quantity causing a ValueError.
-
-        Should return a 400 status code.
-        """
-        mock_auth.return_value = dummy_user()
-        payload = {"type": "chair", "quantity": "non-numeric"}
-        response = client.post("/api/cart/find-and-add", json=payload)
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "invalid literal" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_find_and_add_generic_exception(self, mock_auth, client):
-        """
-        Test POST /api/cart/find-and-add where a generic exception is raised.
-
-        Should return a 500 status code.
-        """
-        dummy = dummy_user()
-        mock_auth.return_value = dummy
-        from app.routes import cart_locator
-
-        with patch.object(
-            cart_locator, "find_and_add_to_cart", side_effect=Exception("Generic error")
-        ):
-            payload = {"name": "chair", "quantity": 1, "color": "red"}
-            response = client.post("/api/cart/find-and-add", json=payload)
-            assert response.status_code == 500
-            data = response.get_json()
-            assert "Generic error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_remove_from_cart_auth_error(self, mock_auth, client):
-        """
-        Test DELETE /api/cart/remove/<furniture_id> when authentication fails.
-
-        Should return a 401 status code.
-        """
-        mock_auth.side_effect = AuthenticationError("Auth error")
-        response = client.delete("/api/cart/remove/furn1?quantity=2")
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_remove_from_cart_value_error(self, mock_auth, client):
-        """
-        Test DELETE /api/cart/remove/<furniture_id>
-        with non-numeric quantity causing a ValueError.
-
-        Should return a 400 status code.
-        """
-        mock_auth.return_value = dummy_user()
-        response = client.delete("/api/cart/remove/furn1?quantity=nonnumeric")
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "invalid literal" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_remove_from_cart_generic_exception(self, mock_auth, client):
-        """
-        Test DELETE /api/cart/remove/<furniture_id>
-        where remove_item raises a generic Exception.
-
-        Should return a 500 status code.
-        """
-        dummy = dummy_user()
-        dummy.shopping_cart.remove_item.side_effect = Exception("Generic error")
-        mock_auth.return_value = dummy
-        response = client.delete("/api/cart/remove/furn1?quantity=2")
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_clear_cart_auth_error(self, mock_auth, client):
-        """
-        Test DELETE /api/cart/clear when authentication fails.
-
-        Should return a 401 status code.
-        """
-        mock_auth.side_effect = AuthenticationError("Auth error")
-        response = client.delete("/api/cart/clear")
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_clear_cart_generic_exception(self, mock_auth, client):
-        """
-        Test DELETE /api/cart/clear where clear raises a generic Exception.
-
-        Should return a 500 status code.
-        """
-        dummy = dummy_user()
-        dummy.shopping_cart.clear.side_effect = Exception("Generic error")
-        mock_auth.return_value = dummy
-        response = client.delete("/api/cart/clear")
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_get_cart_auth_error(self, mock_auth, client):
-        """
-        Test GET /api/cart when authentication fails.
-
-        Should return a 401 status code.
-        """
-        mock_auth.side_effect = AuthenticationError("Auth error")
-        response = client.get("/api/cart")
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_get_cart_generic_exception(self, mock_auth, client):
-        """
-        Test GET /api/cart when get_total raises a generic Exception.
-
-        Should return a 500 status code.
-        """
-        dummy = dummy_user()
-        mock_auth.return_value = dummy
-        dummy.shopping_cart.get_total.side_effect = Exception("Generic error")
-        response = client.get("/api/cart")
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
-
-    @patch("app.routes.get_authenticated_user")
-    def test_apply_discount_auth_error(self, mock_auth, client):
-        """
-        Test POST /api/cart/discount when authentication fails.
-
-        Should return a 401 status code.
-        """
-        mock_auth.side_effect = AuthenticationError("Auth error")
-        payload = {"type": "percentage", "value": 10}
-        response = client.post("/api/cart/discount", json=payload)
-        assert response.status_code == 401
-        data = response.get_json()
-        assert "Auth error" in data["error"]
+        assert_error_body(response, 400, "Missing furniture type")
 
-    @patch("app.routes.get_authenticated_user")
-    def test_apply_discount_value_error(self, mock_auth, client):
+    def test_add_to_cart_no_data(self, client):
         """
-        Test POST /api/cart/discount with non-numeric
-        discount value causing a ValueError.
+        Test POST /api/cart/add with an empty JSON object.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
-        payload = {"discountstrategy": "percentage", "value": "invalid"}
-        response = client.post("/api/cart/discount", json=payload)
-        assert response.status_code == 400
-        data = response.get_json()
-        assert (
-            "could not convert" in data["error"] or "invalid literal" in data["error"]
-        )
-
-    @patch("app.routes.get_authenticated_user")
-    def test_apply_discount_generic_exception(self, mock_auth, client):
-        """
-        Test POST /api/cart/discount when get_total raises a generic Exception.
-
-        Should return a 500 status code.
-        """
-        dummy = dummy_user()
-        mock_auth.return_value = dummy
-        dummy.shopping_cart.get_total.side_effect = Exception("Generic error")
-        payload = {"discountstrategy": "fixed", "value": 10}
-        response = client.post("/api/cart/discount", json=payload)
-        assert response.status_code == 500
-        data = response.get_json()
-        assert "Generic error" in data["error"]
+        response = client.post("/api/cart/add", json={})
+        assert_error_body(response, 400, "No data provided")
 
-    @patch("app.routes.get_authenticated_user")
-    def test_add_to_cart_no_data(self, mock_auth, client):
-        """
-        Test POST /api/cart/add with an empty JSON object.
+    # Exception branches for /cart, /cart/add, /cart/find-and-add,
+    # /cart/remove, /cart/clear and /cart/discount
 
-        Should return a 400 status code.
+    @pytest.mark.parametrize(
+        "method, path, payload, target, exc, expected_code, message",
+        [
+            pytest.param(
+                "POST",
+                "/api/cart/add",
+                _ADD_ITEM_JSON,
+                "auth",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="add-auth-error",
+            ),
+            pytest.param(
+                "POST",
+                "/api/cart/add",
+                {"furniture_id": "furn1", "quantity": "non-numeric"},
+                None,
+                None,
+                400,
+                "invalid literal for int() with base 10: 'non-numeric'",
+                id="add-value-error",
+            ),
+            pytest.param(
+                "POST",
+                "/api/cart/add",
+                _ADD_ITEM_JSON,
+                "inventory.get_furniture",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="add-generic-exception",
+            ),
+            pytest.param(
+                "POST",
+                "/api/cart/find-and-add",
+                {"type": "chair", "quantity": 1},
+                "auth",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="find-and-add-auth-error",
+            ),
+            pytest.param(
+                "POST",
+                "/api/cart/find-and-add",
+                {"type": "chair", "quantity": "non-numeric"},
+                None,
+                None,
+                400,
+                "invalid literal for int() with base 10: 'non-numeric'",
+                id="find-and-add-value-error",
+            ),
+            pytest.param(
+                "POST",
+                "/api/cart/find-and-add",
+                _FIND_CHAIR_JSON,
+                "cart_locator.find_and_add_to_cart",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="find-and-add-generic-exception",
+            ),
+            pytest.param(
+                "DELETE",
+                "/api/cart/remove/furn1?quantity=2",
+                None,
+                "auth",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="remove-auth-error",
+            ),
+            pytest.param(
+                "DELETE",
+                "/api/cart/remove/furn1?quantity=nonnumeric",
+                None,
+                None,
+                None,
+                400,
+                "invalid literal for int() with base 10: 'nonnumeric'",
+                id="remove-value-error",
+            ),
+            pytest.param(
+                "DELETE",
+                "/api/cart/remove/furn1?quantity=2",
+                None,
+                "cart.remove_item",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="remove-generic-exception",
+            ),
+            pytest.param(
+                "DELETE",
+                "/api/cart/clear",
+                None,
+                "auth",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="clear-auth-error",
+            ),
+            pytest.param(
+                "DELETE",
+                "/api/cart/clear",
+                None,
+                "cart.clear",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="clear-generic-exception",
+            ),
+            pytest.param(
+                "GET",
+                "/api/cart",
+                None,
+                "auth",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="get-auth-error",
+            ),
+            pytest.param(
+                "GET",
+                "/api/cart",
+                None,
+                "cart.get_total",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="get-generic-exception",
+            ),
+            pytest.param(
+                "POST",
+                "/api/cart/discount",
+                {"type": "percentage", "value": 10},
+                "auth",
+                AuthenticationError("Auth error"),
+                401,
+                "Auth error",
+                id="discount-auth-error",
+            ),
+            pytest.param(
+                "POST",
+                "/api/cart/discount",
+                {"discountstrategy": "percentage", "value": "invalid"},
+                None,
+                None,
+                400,
+                "could not convert string to float: 'invalid'",
+                id="discount-value-error",
+            ),
+            pytest.param(
+                "POST",
+                "/api/cart/discount",
+                {"discountstrategy": "fixed", "value": 10},
+                "cart.get_total",
+                Exception("Generic error"),
+                500,
+                "Generic error",
+                id="discount-generic-exception",
+            ),
+        ],
+    )
+    def test_error_paths(
+        self,
+        dummy,
+        as_user,
+        monkeypatch,
+        client,
+        method,
+        path,
+        payload,
+        target,
+        exc,
+        expected_code,
+        message,
+    ):
         """
-        mock_auth.return_value = dummy_user()
-        response = client.post("/api/cart/add", json={})
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "No data provided" in data["error"]
+        Test cart routes when the request is invalid or a dependency raises.
+
+        target names what raises exc: "auth" (get_authenticated_user),
+        "cart.<method>" (the user's shopping cart) or "<service>.<method>"
+        (a module-level service in app.routes). With no target, the payload
+        itself is invalid. The response should carry the expected status code
+        and error message.
+        """
+        if target == "auth":
+            as_user(exc)
+        elif target is not None:
+            owner, attr = target.split(".")
+            if owner == "cart":
+                dummy.shopping_cart = tracked_cart()
+                getattr(dummy.shopping_cart, attr).side_effect = exc
+            else:
+                monkeypatch.setattr(
+                    getattr(routes, owner), attr, MagicMock(side_effect=exc)
+                )
+        response = client.open(path, method=method, json=payload)
+        assert response.status_code == expected_code
+        assert response.json == {"error": message}
 
 
 # =============================================================================
 # Checkout & Orders Routes Tests
 # =============================================================================
 
+# Static stand-ins for what process_checkout's response reads
+_CREDIT_CARD = SimpleNamespace(value="CreditCard")
+_DUMMY_ORDER = SimpleNamespace(
+    order_id="order1",
+    user_id="user123",
+    total_price=100,
+    payment_method=_CREDIT_CARD,
+    date=SimpleNamespace(isoformat=lambda: "2025-03-08T00:00:00"),
+    items=[1, 2],
+)
+
 
 class TestCheckoutOrdersRoutes:
     """Tests for checkout and order routes."""
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.checkout_system.process_checkout")
-    @patch("app.routes.PaymentMethod", return_value=MagicMock(value="CreditCard"))
-    def test_process_checkout_valid(
-        self, mock_payment_method, mock_checkout, mock_auth, client
-    ):
+    @pytest.fixture(autouse=True)
+    def dummy(self, as_user):
+        """Authenticate every request as a fresh dummy user by default."""
+        return as_user(dummy_user())
+
+    def test_process_checkout_valid(self, client, patch_attr):
         """
         Test POST /api/checkout with valid payment method.
 
         Should return a 201 status code and order details.
         """
-        dummy = dummy_user()
-        mock_auth.return_value = dummy
-        dummy_order = MagicMock()
-        dummy_order.order_id = "order1"
-        dummy_order.user_id = dummy.id
-        dummy_order.total_price = 100
-        dummy_order.payment_method = MagicMock(value="CreditCard")
-        dummy_order.date.isoformat.return_value = "2025-03-08T00:00:00"
-        dummy_order.items = [1, 2]
-        mock_checkout.return_value = dummy_order
-        payload = {"payment_method": "CreditCard"}
-        response = client.post("/api/checkout", json=payload)
+        patch_attr(routes, "PaymentMethod", return_value=_CREDIT_CARD)
+        patch_attr(
+            routes.checkout_system, "process_checkout", return_value=_DUMMY_ORDER
+        )
+        response = client.post("/api/checkout", json=_CHECKOUT_JSON)
         assert response.status_code == 201
-        data = response.get_json()
+        data = response.json
         assert data["order_id"] == "order1"
 
-    @patch("app.routes.get_authenticated_user")
-    def test_process_checkout_invalid_payment(self, mock_auth, client):
+    def test_process_checkout_invalid_payment(self, client):
         """
         Test POST /api/checkout with an invalid payment method.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
         payload = {"payment_method": "InvalidMethod"}
         response = client.post("/api/checkout", json=payload)
         assert response.status_code == 400
 
-    @patch("app.routes.get_authenticated_user")
-    def test_process_checkout_no_data(self, mock_auth, client):
+    def test_process_checkout_no_data(self, client):
         """
         Test POST /api/checkout with no data provided.
 
         Should return a 400 status code.
         """
-        mock_auth.return_value = dummy_user()
         response = client.post("/api/checkout", json={})
         assert response.status_code == 400
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.order_manager.get_user_orders")
-    def test_get_user_orders(self, mock_get_orders, mock_auth, client):
+    def test_get_user_orders(self, client, dummy, patch_attr):
         """
         Test GET /api/orders returns the orders for the authenticated user.
 
         Should return a 200 status code and a list of orders.
         """
-        dummy = dummy_user()
-        dummy.id = "user1"
-        mock_auth.return_value = dummy
         orders = [{"order_id": "order1"}]
-        mock_get_orders.return_value = orders
+        patch_attr(routes.order_manager, "get_user_orders", return_value=orders)
+        dummy.id = "user1"
         response = client.get("/api/orders")
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert data == orders
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.order_manager.get_order")
-    def test_get_order_details_success(self, mock_get_order, mock_auth, client):
+    def test_get_order_details_success(self, client, dummy, patch_attr):
         """
         Test GET /api/orders/<order_id> for a valid order.
 
         Should return a 200 status code with order details.
         """
-        dummy = dummy_user()
-        dummy.id = "user1"
-        mock_auth.return_value = dummy
         order = {"order_id": "order1", "user_id": "user1"}
-        mock_get_order.return_value = order
+        patch_attr(routes.order_manager, "get_order", return_value=order)
+        dummy.id = "user1"
         response = client.get("/api/orders/order1")
         assert response.status_code == 200
-        data = response.get_json()
+        data = response.json
         assert data["order_id"] == "order1"
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.order_manager.get_order")
-    def test_get_order_details_not_found(self, mock_get_order, mock_auth, client):
+    def test_get_order_details_not_found(self, client, dummy, patch_attr):
         """
         Test GET /api/orders/<order_id> when the order is not found.
 
         Should return a 404 status code.
         """
-        dummy = dummy_user()
+        patch_attr(routes.order_manager, "get_order", return_value=None)
         dummy.id = "user1"
-        mock_auth.return_value = dummy
-        mock_get_order.return_value = None
         response = client.get("/api/orders/nonexistent")
         assert response.status_code == 404
 
-    @patch("app.routes.get_authenticated_user")
-    @patch("app.routes.order_manager.get_order")
-    def test_get_order_details_access_denied(self, mock_get_order, mock_auth, client):
+    def test_get_order_details_access_denied(self, client, dummy, patch_attr):
         """
         Test GET /api/orders/<order_id> when the order does not belong to the user.
 
         Should return a 403 status code.
         """
-        dummy = dummy_user()
-        dummy.id = "user1"
-        mock_auth.return_value = dummy
         order = {"order_id": "order1", "user_id": "otheruser"}
-        mock_get_order.return_value = order
+        patch_attr(routes.order_manager, "get_order", return_value=order)
+        dummy.id = "user1"
         response = client.get("/api/orders/order1")
         assert response.status_code == 403
 
-    @patch("app.routes.get_authenticated_user")
-    def test_process_checkout_missing_payment_method(self, mock_auth, client):
+    def test_process_checkout_missing_payment_method(self, client):
         """
         Test POST /api/checkout when payment_method is missing.
 
         Should return a 400 status code with an error message.
         """
-        mock_auth.return_value = dummy_user()
         response = client.post("/api/checkout", json={"some": "data"})
-        assert response.status_code == 400
-        data = response.get_json()
-        assert "Missing payment method" in data["error"]
+        assert_error_body(response, 400, "Missing payment method")
 
 
 # Parameterized test for checkout exception branches
 @pytest.mark.parametrize(
     "auth_exception, payment_exception, checkout_exception,\
-        expected_status, expected_error_substring",
+        expected_status, expected_error",
     [
         (AuthenticationError("Test auth error"), None, None, 401, "Test auth error"),
-        (None, ValueError("Test ValueValue"), None, 400, "Invalid payment method."),
+        (
+            None,
+            ValueError("Test ValueValue"),
+            None,
+            400,
+            "Invalid payment method. Valid options are: "
+            + ", ".join(method.value for method in PaymentMethod),
+        ),
         (None, None, Exception("Generic error"), 500, "Generic error"),
         (None, None, ValueError("Test outer ValueError"), 400, "Test outer ValueError"),
     ],
 )
-@patch("app.routes.checkout_system.process_checkout")
-@patch("app.routes.PaymentMethod")
-@patch("app.routes.get_authenticated_user")
 def test_process_checkout_exceptions(
-    mock_get_authenticated_user,
-    mock_payment_method,
-    mock_checkout,
     client,
     auth_exception,
     payment_exception,
     checkout_exception,
     expected_status,
-    expected_error_substring,
+    expected_error,
+    as_user,
+    patch_attr,
 ):
     """
     Parameterized test for POST /api/checkout that covers various exception scenarios.
@@ -1868,26 +1838,24 @@ def test_process_checkout_exceptions(
     or checkout processing, the endpoint should return
     the expected status code and error message.
     """
-    if auth_exception:
-        mock_get_authenticated_user.side_effect = auth_exception
-    else:
-        mock_get_authenticated_user.return_value = dummy_user()
+    mock_payment_method = patch_attr(routes, "PaymentMethod")
+    mock_checkout = patch_attr(
+        routes.checkout_system, "process_checkout", return_value=_DUMMY_ORDER
+    )
+    as_user(auth_exception or object())
 
     if payment_exception:
         mock_payment_method.side_effect = payment_exception
+        # The error lists the valid options by iterating PaymentMethod
+        mock_payment_method.__iter__.return_value = iter(PaymentMethod)
     else:
-        dummy_payment = MagicMock()
-        dummy_payment.value = "CreditCard"
-        mock_payment_method.return_value = dummy_payment
+        mock_payment_method.return_value = _CREDIT_CARD
 
     if checkout_exception:
         mock_checkout.side_effect = checkout_exception
 
-    payload = {"payment_method": "CreditCard"}
-    response = client.post("/api/checkout", json=payload)
-    assert response.status_code == expected_status
-    data = response.get_json()
-    assert expected_error_substring in data["error"]
+    response = client.post("/api/checkout", json=_CHECKOUT_JSON)
+    assert_error_body(response, expected_status, expected_error)
 
 
 # =============================================================================
@@ -1895,27 +1863,33 @@ def test_process_checkout_exceptions(
 # =============================================================================
 
 
+def _enum_members(enum_cls):
+    """Return the JSON body an enum route should produce for enum_cls."""
+    return [{"value": member.value, "name": member.name} for member in enum_cls]
+
+
+_ENUM_URLS = [
+    ("/api/enums/payment-methods", _enum_members(PaymentMethod)),
+    ("/api/enums/chair-materials", _enum_members(ChairMaterial)),
+    ("/api/enums/table-shapes", _enum_members(TableShape)),
+    ("/api/enums/furniture-sizes", _enum_members(FurnitureSize)),
+    ("/api/enums/sofa-colors", _enum_members(SofaColor)),
+    ("/api/enums/bed-sizes", _enum_members(BedSize)),
+]
+
+
 @pytest.mark.parametrize(
-    "url",
-    [
-        "/api/enums/payment-methods",
-        "/api/enums/chair-materials",
-        "/api/enums/table-shapes",
-        "/api/enums/furniture-sizes",
-        "/api/enums/sofa-colors",
-        "/api/enums/bed-sizes",
-    ],
+    "url, expected", _ENUM_URLS, ids=[url.rsplit("/", 1)[1] for url, _ in _ENUM_URLS]
 )
-def test_enum_routes(client, url):
+def test_enum_routes(client, url, expected):
     """
-    Test various enum routes to ensure they return a list.
+    Test the enum routes.
 
-    Should return a 200 status code and the response data must be a list.
+    Each should return a 200 status code and every member of its enum.
     """
     response = client.get(url)
     assert response.status_code == 200
-    data = response.get_json()
-    assert isinstance(data, list)
+    assert response.json == expected
 
 
 # =============================================================================
@@ -1923,42 +1897,40 @@ def test_enum_routes(client, url):
 # =============================================================================
 
 
-def test_get_authenticated_user_valid():
+def test_get_authenticated_user_valid(flask_app, patch_attr):
     """
     Test that a valid 'Authorization' header returns a user.
 
     Patches the authenticate_with_token method to return a dummy user.
     """
-    app = Flask(__name__)
-    with app.test_request_context("/", headers={"Authorization": "Bearer validtoken"}):
+    with flask_app.test_request_context(
+        "/", headers={"Authorization": "Bearer validtoken"}
+    ):
         dummy_user_obj = MagicMock()
         dummy_user_obj.id = "user1"
-        with patch(
-            "app.routes.user_manager.authenticate_with_token",
-            return_value=dummy_user_obj,
-        ) as mock_auth:
-            user = get_authenticated_user()
-            assert user.id == "user1"
-            mock_auth.assert_called_once_with("validtoken")
+        mock_auth = patch_attr(
+            routes.user_manager, "authenticate_with_token", return_value=dummy_user_obj
+        )
+        user = get_authenticated_user()
+        assert user.id == "user1"
+        mock_auth.assert_called_once_with("validtoken")
 
 
-def test_get_authenticated_user_missing_header():
+def test_get_authenticated_user_missing_header(flask_app):
     """
     Test that a missing Authorization header raises an AuthenticationError.
     """
-    app = Flask(__name__)
-    with app.test_request_context("/"):
+    with flask_app.test_request_context("/"):
         with pytest.raises(AuthenticationError) as excinfo:
             get_authenticated_user()
         assert "Missing or invalid Authorization header" in str(excinfo.value)
 
 
-def test_get_authenticated_user_invalid_header():
+def test_get_authenticated_user_invalid_header(flask_app):
     """
     Test that an invalid Authorization header format raises an AuthenticationError.
     """
-    app = Flask(__name__)
-    with app.test_request_context(
+    with flask_app.test_request_context(
         "/", headers={"Authorization": "InvalidToken sometoken"}
     ):
         with pytest.raises(AuthenticationError) as excinfo:
@@ -1966,29 +1938,25 @@ def test_get_authenticated_user_invalid_header():
         assert "Missing or invalid Authorization header" in str(excinfo.value)
 
 
-def test_get_furniture_by_id_exception(client, mocker):
+def test_get_furniture_by_id_exception(client, patch_attr):
     """
     Test GET /api/furniture/<furniture_id>
     when inventory.get_furniture raises an exception.
 
     Should return a 500 status code.
     """
-    mocker.patch(
-        "app.routes.inventory.get_furniture", side_effect=Exception("Test error")
-    )
+    patch_attr(routes.inventory, "get_furniture", side_effect=Exception("Test error"))
     response = client.get("/api/furniture/123")
-    assert response.status_code == 500
-    data = response.get_json()
-    assert "Test error" in data["error"]
+    assert_error_body(response, 500, "Test error")
 
 
-def test_add_furniture_missing_required_fields(client, mocker):
+def test_add_furniture_missing_required_fields(client, as_user):
     """
     Test POST /api/furniture with missing required fields.
 
     Should return a 400 status code with an appropriate error message.
     """
-    mocker.patch("app.routes.get_authenticated_user", return_value=dummy_user())
+    as_user(object())
     payload = {
         "name": "",
         "quantity": 2,
@@ -1996,72 +1964,60 @@ def test_add_furniture_missing_required_fields(client, mocker):
         "description": "A comfy chair",
     }
     response = client.post("/api/furniture", json=payload)
-    assert response.status_code == 400
-    data = response.get_json()
-    assert "Missing a required field: name/price/description" in data["error"]
-
-
-def test_get_order_details_auth_error(client, mocker):
-    """
-    Test GET /api/orders/<order_id> when authentication fails.
-
-    Should return a 401 status code.
-    """
-    mocker.patch(
-        "app.routes.get_authenticated_user",
-        side_effect=AuthenticationError("Auth error"),
-    )
-    response = client.get("/api/orders/someorder")
-    assert response.status_code == 401
-    data = response.get_json()
-    assert "Auth error" in data["error"]
-
-
-def test_get_order_details_exception(client, mocker):
-    """
-    Test GET /api/orders/<order_id> when order_manager.get_order raises an exception.
-
-    Should return a 500 status code.
-    """
-    dummy = dummy_user()
-    mocker.patch("app.routes.get_authenticated_user", return_value=dummy)
-    mocker.patch(
-        "app.routes.order_manager.get_order", side_effect=Exception("Test error")
-    )
-    response = client.get("/api/orders/someorder")
-    assert response.status_code == 500
-    data = response.get_json()
-    assert "Test error" in data["error"]
-
-
-def test_get_user_orders_auth_error(client, mocker):
-    """
-    Test GET /api/orders when authentication fails.
-
-    Should return a 401 status code.
-    """
-    mocker.patch(
-        "app.routes.get_authenticated_user",
-        side_effect=AuthenticationError("Auth error"),
-    )
-    response = client.get("/api/orders")
-    assert response.status_code == 401
-    data = response.get_json()
-    assert "Auth error" in data["error"]
+    assert_error_body(response, 400, "Missing a required field: name/price/description")
 
 
-def test_get_user_orders_exception(client, mocker):
+@pytest.mark.parametrize(
+    "path, target, exc, expected_code, message",
+    [
+        pytest.param(
+            "/api/orders/someorder",
+            "auth",
+            AuthenticationError("Auth error"),
+            401,
+            "Auth error",
+            id="order-details-auth-error",
+        ),
+        pytest.param(
+            "/api/orders/someorder",
+            "get_order",
+            Exception("Test error"),
+            500,
+            "Test error",
+            id="order-details-exception",
+        ),
+        pytest.param(
+            "/api/orders",
+            "auth",
+            AuthenticationError("Auth error"),
+            401,
+            "Auth error",
+            id="user-orders-auth-error",
+        ),
+        pytest.param(
+            "/api/orders",
+            "get_user_orders",
+            Exception("Test error"),
+            500,
+            "Test error",
+            id="user-orders-exception",
+        ),
+    ],
+)
+def test_order_routes_errors(
+    client, as_user, monkeypatch, path, target, exc, expected_code, message
+):
     """
-    Test GET /api/orders when order_manager.get_user_orders raises an exception.
+    Test GET /api/orders and /api/orders/<order_id> when something raises.
 
-    Should return a 500 status code.
+    target is either "auth" (get_authenticated_user raises) or the name of the
+    order_manager method that raises. The response should carry the expected
+    status code and error message.
     """
-    dummy = dummy_user()
-    mocker.patch("app.routes.get_authenticated_user", return_value=dummy)
-    mocker.patch(
-        "app.routes.order_manager.get_user_orders", side_effect=Exception("Test error")
-    )
-    response = client.get("/api/orders")
-    assert response.status_code == 500
-    data = response.get_json()
-    assert "Test error" in data["error"]
+    if target == "auth":
+        as_user(exc)
+    else:
+        as_user(_BARE_USER)
+        monkeypatch.setattr(routes.order_manager, target, MagicMock(side_effect=exc))
+    response = client.get(path)
+    assert_error_body(response, expected_code, message)
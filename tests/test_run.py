@@ -1,19 +1,7 @@
-import pytest
-
-from run import app  # Import `app` from `app.py` (ensuring it runs)
-
-
-@pytest.fixture
-def client():
-    """Create a test client for making API requests."""
-    app.config["TESTING"] = True
-    return app.test_client()
-
-
-def test_app_creation():
+def test_app_creation(flask_app):
     """Test that the app instance is created successfully."""
-    assert app is not None
-    assert "api" in app.blueprints
+    assert flask_app is not None
+    assert "api" in flask_app.blueprints
 
 
 def test_root_endpoint(client):
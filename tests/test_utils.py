@@ -1,5 +1,4 @@
 import json
-from pathlib import Path
 
 import pytest
 
@@ -11,75 +10,50 @@ from app.utils import JsonFileManager, JsonFileManagerError
 
 
 @pytest.mark.parametrize("default_content", [None, [{"key": "value"}], []])
-@pytest.mark.parametrize("file_path_type", [str, Path])
-def test_ensure_file_exists_creates_file(
-    tmp_path, default_content, file_path_type
-) -> None:
+def test_ensure_file_exists_creates_file(tmp_path, default_content) -> None:
     """Test that ensure_file_exists creates a file with correct content."""
     # Create a file path that does not exist.
     file_path = tmp_path / "nonexistent.json"
-    file_path_input = str(file_path) if file_path_type == str else file_path
     if file_path.exists():
         file_path.unlink()
     # Call ensure_file_exists; it should create the file with default content.
-    JsonFileManager.ensure_file_exists(file_path_input, default_content)
+    JsonFileManager.ensure_file_exists(file_path, default_content)
     assert file_path.exists()
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = JsonFileManager.read_json(file_path)
     expected = [] if default_content is None else default_content
     assert data == expected
 
 
-@pytest.mark.parametrize("file_path_type", [str, Path])
-def test_ensure_file_exists_already_exists(tmp_path, file_path_type) -> None:
+def test_ensure_file_exists_already_exists(tmp_path) -> None:
     """Test that ensure_file_exists doesn't modify existing files."""
     # Create a file that already exists with some content.
     file_path = tmp_path / "existing.json"
     content = [{"a": 1}]
     file_path.write_text(json.dumps(content))
-    file_path_input = str(file_path) if file_path_type == str else file_path
     # Call ensure_file_exists with a different default; file should remain unchanged.
-    JsonFileManager.ensure_file_exists(file_path_input, [{"b": 2}])
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    JsonFileManager.ensure_file_exists(file_path, [{"b": 2}])
+    data = json.loads(file_path.read_text(encoding="utf-8"))
     assert data == content
 
 
-def test_ensure_file_exists_io_error(monkeypatch, tmp_path) -> None:
-    """Test that ensure_file_exists handles IO errors correctly."""
-    # Simulate an IOError when trying to open the file for writing.
-    file_path = tmp_path / "error.json"
-
-    def fake_open(*args, **kwargs):
-        raise IOError("fake error")
-
-    monkeypatch.setattr("builtins.open", fake_open)
-    with pytest.raises(JsonFileManagerError, match="Could not create file"):
-        JsonFileManager.ensure_file_exists(file_path)
-
-
 # ---------------------------
 # Tests for read_json
 # ---------------------------
-@pytest.mark.parametrize("file_path_type", [str, Path])
-def test_read_json_valid(tmp_path, file_path_type) -> None:
+def test_read_json_valid(tmp_path) -> None:
     """Test reading valid JSON data from a file."""
     # Create a file with valid JSON.
     file_path = tmp_path / "valid.json"
     content = [{"key": "value"}]
     file_path.write_text(json.dumps(content))
-    file_path_input = str(file_path) if file_path_type == str else file_path
-    data = JsonFileManager.read_json(file_path_input)
+    data = JsonFileManager.read_json(file_path)
     assert data == content
 
 
-@pytest.mark.parametrize("file_path_type", [str, Path])
-def test_read_json_file_not_found(tmp_path, file_path_type) -> None:
+def test_read_json_file_not_found(tmp_path) -> None:
     """Test reading from a non-existent file returns empty list."""
     # Provide a path to a file that doesn't exist.
     file_path = tmp_path / "nonexistent.json"
-    file_path_input = str(file_path) if file_path_type == str else file_path
-    data = JsonFileManager.read_json(file_path_input)
+    data = JsonFileManager.read_json(file_path)
     assert data == []
 
 
@@ -91,40 +65,52 @@ def test_read_json_invalid_json(tmp_path) -> None:
         JsonFileManager.read_json(file_path)
 
 
-def test_read_json_io_error(monkeypatch, tmp_path) -> None:
-    """Test read_json handles IO errors correctly."""
-    file_path = tmp_path / "io_error.json"
-
-    def fake_open(*args, **kwargs):
-        raise IOError("fake read error")
-
-    monkeypatch.setattr("builtins.open", fake_open)
-    with pytest.raises(JsonFileManagerError, match="Could not read file"):
-        JsonFileManager.read_json(file_path)
-
-
 # ---------------------------
 # Tests for write_json
 # ---------------------------
-@pytest.mark.parametrize("file_path_type", [str, Path])
-def test_write_json_success(tmp_path, file_path_type) -> None:
+def test_write_json_success(tmp_path) -> None:
     """Test writing JSON data to a file successfully."""
     file_path = tmp_path / "output.json"
     data_to_write = [{"key": "value"}]
-    file_path_input = str(file_path) if file_path_type == str else file_path
-    JsonFileManager.write_json(file_path_input, data_to_write)
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    JsonFileManager.write_json(file_path, data_to_write)
+    data = JsonFileManager.read_json(file_path)
     assert data == data_to_write
 
 
-def test_write_json_io_error(monkeypatch, tmp_path) -> None:
-    """Test write_json handles IO errors correctly."""
-    file_path = tmp_path / "output_error.json"
+# ---------------------------
+# Tests for path handling
+# ---------------------------
+def test_accepts_str_and_path(tmp_path) -> None:
+    """Test that str paths behave the same as Path objects."""
+    file_path = tmp_path / "paths.json"
+    content = [{"key": "value"}]
+    JsonFileManager.ensure_file_exists(str(file_path))
+    JsonFileManager.write_json(str(file_path), content)
+    assert JsonFileManager.read_json(str(file_path)) == content
+    assert JsonFileManager.read_json(file_path) == content
+
+
+# ---------------------------
+# Tests for IO errors
+# ---------------------------
+@pytest.mark.parametrize(
+    "operation, match",
+    [
+        (JsonFileManager.ensure_file_exists, "Could not create file"),
+        (JsonFileManager.read_json, "Could not read file"),
+        (
+            lambda path: JsonFileManager.write_json(path, [{"key": "value"}]),
+            "Could not write to file",
+        ),
+    ],
+    ids=["ensure_file_exists", "read_json", "write_json"],
+)
+def test_io_error(monkeypatch, tmp_path, operation, match) -> None:
+    """Test that IO errors are wrapped in JsonFileManagerError."""
 
     def fake_open(*args, **kwargs):
-        raise IOError("fake write error")
+        raise IOError("fake error")
 
     monkeypatch.setattr("builtins.open", fake_open)
-    with pytest.raises(JsonFileManagerError, match="Could not write to file"):
-        JsonFileManager.write_json(file_path, [{"key": "value"}])
+    with pytest.raises(JsonFileManagerError, match=match):
+        operation(tmp_path / "error.json")
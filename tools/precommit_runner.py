@@ -1,33 +1,51 @@
 #!/usr/bin/env python3
 """
-Script to run pre-commit hooks on individual files with backup functionality.
+Script to run pre-commit hooks on individual files with undo support.
 Simplified to work with black, isort, and flake8.
 """
 import argparse
 import os
-import shutil
 import subprocess
-import sys
-from typing import List, Optional
+from pathlib import Path
+from typing import Iterator, List, Optional
 
+# Directories never searched for Python files (hidden directories are also skipped)
+SKIP_DIRS = frozenset({"__pycache__", "venv", "node_modules"})
 
-def get_python_files(directory: str = ".") -> List[str]:
-    """Get all Python files in the given directory and subdirectories."""
-    python_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".py"):
-                filepath = os.path.join(root, file)
-                python_files.append(filepath)
-    return python_files
+# Files passed to a single tool invocation, keeping the command line short
+BATCH_SIZE = 500
 
+TOOL_COMMANDS = {
+    "black": ["black"],
+    "isort": ["isort"],
+    "flake8": ["flake8"],
+}
 
-def backup_file(filename: str) -> str:
-    """Create a backup of the file before modifying it."""
-    backup_filename = f"{filename}.bak"
-    shutil.copy2(filename, backup_filename)
-    print(f"Created backup: {backup_filename}")
-    return backup_filename
+
+def get_python_files(directory: str = ".") -> Iterator[str]:
+    """
+    Yield all Python files in the given directory and subdirectories.
+
+    Virtualenv, cache, VCS and other hidden directories are pruned rather than
+    walked.
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        # Skip unreadable directories, as os.walk does
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS and not entry.name.startswith("."):
+                    yield from get_python_files(entry.path)
+            elif entry.name.endswith(".py"):
+                yield entry.path
+
+
+def snapshot(filename: str) -> bytes:
+    """Read the file's contents so they can be restored after hooks modify it."""
+    return Path(filename).read_bytes()
 
 
 def run_precommit_on_file(filename: str, hook_id: Optional[str] = None) -> bool:
@@ -40,16 +58,10 @@ def run_precommit_on_file(filename: str, hook_id: Optional[str] = None) -> bool:
 
     print(f"\n{'=' * 80}")
     print(f"Running pre-commit on: {filename}")
-    print(f"{'=' * 80}")
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    # Print the output
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
+    print(f"{'=' * 80}", flush=True)
 
+    # The hooks write straight to our stdout/stderr as they run
+    result = subprocess.run(cmd)
     return result.returncode == 0
 
 
@@ -58,31 +70,44 @@ def run_specific_tool(filename: str, tool: str) -> bool:
     Run a specific formatting tool directly instead of through pre-commit.
     Useful for targeted fixes.
     """
-    commands = {
-        "black": ["black", filename],
-        "isort": ["isort", filename],
-        "flake8": ["flake8", filename],
-    }
-
-    if tool not in commands:
+    if tool not in TOOL_COMMANDS:
         print(f"Unknown tool: {tool}. Available tools: black, isort, flake8")
         return False
 
-    print(f"\nRunning {tool} on {filename}...")
-    result = subprocess.run(commands[tool], capture_output=True, text=True)
+    print(f"\nRunning {tool} on {filename}...", flush=True)
+    result = subprocess.run(TOOL_COMMANDS[tool] + [filename])
+    return result.returncode == 0
 
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
 
-    return result.returncode == 0
+def run_on_files(
+    filenames: List[str], tool: Optional[str] = None, hook_id: Optional[str] = None
+) -> bool:
+    """
+    Run pre-commit hooks, or a specific tool, on many files at once.
+
+    Files are passed in batches of BATCH_SIZE, so each batch costs a single
+    process start-up instead of one per file.
+    """
+    success = True
+    for start in range(0, len(filenames), BATCH_SIZE):
+        batch = filenames[start : start + BATCH_SIZE]
+        if tool:
+            cmd = TOOL_COMMANDS[tool] + batch
+        else:
+            cmd = ["pre-commit", "run", "--files", *batch]
+            if hook_id:
+                cmd.insert(2, hook_id)
+
+        print(f"\nRunning {tool or 'pre-commit'} on {len(batch)} files...", flush=True)
+        result = subprocess.run(cmd)
+        success = success and result.returncode == 0
+    return success
 
 
 def main() -> None:
     """Main function to run the script."""
     parser = argparse.ArgumentParser(
-        description="Run pre-commit hooks on individual files with backup functionality"
+        description="Run pre-commit hooks on individual files with undo support"
     )
     parser.add_argument(
         "files", nargs="*", help="Specific files to process (default: all Python files)"
@@ -100,13 +125,15 @@ def main() -> None:
         help="Interactive mode - process one file at a time",
     )
     parser.add_argument(
-        "--no-backup", action="store_true", help="Skip creating backup files"
+        "--no-backup",
+        action="store_true",
+        help="Don't snapshot files for undo in interactive mode",
     )
 
     args = parser.parse_args()
 
     # Get files to process - either specified files or all Python files
-    files = args.files if args.files else get_python_files()
+    files = args.files if args.files else list(get_python_files())
 
     if not files:
         print("No Python files found to process.")
@@ -114,56 +141,30 @@ def main() -> None:
 
     print(f"Found {len(files)} files to process.")
 
+    existing_files = []
     for file in files:
-        if not os.path.isfile(file):
+        if os.path.isfile(file):
+            existing_files.append(file)
+        else:
             print(f"Warning: File not found: {file}")
-            continue
-
-        # Create backup unless disabled
-        backup = None
-        if not args.no_backup:
-            backup = backup_file(file)
-
-        if args.interactive:
-            while True:
-                if args.tool:
-                    success = run_specific_tool(file, args.tool)
-                else:
-                    success = run_precommit_on_file(file, args.hook)
-
-                if success:
-                    print(f"All checks passed for: {file}")
-                    break
-                else:
-                    print(f"Some checks failed for: {file}")
-
-                    choice = input(
-                        "\nPlease fix the issues manually and then:\n"
-                        "[r] - Re-check this file\n"
-                        "[s] - Skip to next file\n"
-                        "[q] - Quit\n"
-                        "[u] - Undo changes (restore backup)\n"
-                        "[b] - Run black\n"
-                        "[i] - Run isort\n"
-                        "[f] - Run flake8\n"
-                        "Enter choice [r/s/q/u/b/i/f]: "
-                    ).lower()
-
-                    if choice == "q":
-                        return
-                    elif choice == "s":
-                        break
-                    elif choice == "u" and backup:
-                        shutil.copy2(backup, file)
-                        print(f"Restored {file} from backup")
-                    elif choice == "b":
-                        run_specific_tool(file, "black")
-                    elif choice == "i":
-                        run_specific_tool(file, "isort")
-                    elif choice == "f":
-                        run_specific_tool(file, "flake8")
-                    # Default is to re-check (for 'r' or any other input)
+
+    if not existing_files:
+        print("No files to check.")
+        return
+
+    if not args.interactive:
+        # Nothing can be undone here, so no snapshots are taken
+        if run_on_files(existing_files, args.tool, args.hook):
+            print("All checks passed.")
         else:
+            print("Some checks failed.")
+        return
+
+    for file in existing_files:
+        # Keep the original contents in memory for undo unless disabled
+        original = None if args.no_backup else snapshot(file)
+
+        while True:
             if args.tool:
                 success = run_specific_tool(file, args.tool)
             else:
@@ -171,10 +172,39 @@ def main() -> None:
 
             if success:
                 print(f"All checks passed for: {file}")
+                break
             else:
                 print(f"Some checks failed for: {file}")
-                if backup:
-                    print(f"You can restore from backup: {backup}")
+
+                choice = input(
+                    "\nPlease fix the issues manually and then:\n"
+                    "[r] - Re-check this file\n"
+                    "[s] - Skip to next file\n"
+                    "[q] - Quit\n"
+                    "[u] - Undo changes (restore original)\n"
+                    "[b] - Run black\n"
+                    "[i] - Run isort\n"
+                    "[f] - Run flake8\n"
+                    "Enter choice [r/s/q/u/b/i/f]: "
+                ).lower()
+
+                if choice == "q":
+                    return
+                elif choice == "s":
+                    break
+                elif choice == "u":
+                    if original is None:
+                        print("Nothing to undo: snapshots are off (--no-backup)")
+                    else:
+                        Path(file).write_bytes(original)
+                        print(f"Restored original contents of {file}")
+                elif choice == "b":
+                    run_specific_tool(file, "black")
+                elif choice == "i":
+                    run_specific_tool(file, "isort")
+                elif choice == "f":
+                    run_specific_tool(file, "flake8")
+                # Default is to re-check (for 'r' or any other input)
 
 
 if __name__ == "__main__":